@@ -12,8 +12,11 @@ def main():
     t1 = time.perf_counter()
     seg.segy_scan(DATA_DIR, PATTERN)
     t2 = time.perf_counter()
+    seg.segy_scan(DATA_DIR, PATTERN, executor="process")
+    t3 = time.perf_counter()
     print(f"Sequential: {t1 - t0:.3f}s")
     print(f"Threaded:   {t2 - t1:.3f}s")
+    print(f"Processes:  {t3 - t2:.3f}s")
 
 
 if __name__ == '__main__':
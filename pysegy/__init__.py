@@ -8,6 +8,7 @@ from .types import (
     BinaryTraceHeader,
     FileHeader,
     SeisBlock,
+    TraceHeaderTable,
 )
 from .read import (
     read_fileheader,
@@ -15,18 +16,22 @@ from .read import (
     read_file,
     segy_read,
 )
+from .memmap import SegyMmap, segy_mmap
+from .aio import asegy_read
 from .scan import (
     ShotRecord,
     SegyScan,
     segy_scan,
-    save_scan,
-    load_scan
 )
+from .index import save_scan, load_scan
+from .cache import ShotCache, shot_cache
 from .write import (
     write_fileheader,
     write_traceheader,
     write_block,
     segy_write,
+    segy_patch_headers,
+    SegyWriter,
 )
 from .utils import get_header
 from .plotting import (
@@ -43,19 +48,27 @@ __all__ = [
     "BinaryTraceHeader",
     "FileHeader",
     "SeisBlock",
+    "TraceHeaderTable",
     "SegyScan",
     "ShotRecord",
     "read_fileheader",
     "read_traceheader",
     "read_file",
     "segy_read",
+    "asegy_read",
+    "SegyMmap",
+    "segy_mmap",
     "segy_scan",
     "save_scan",
     "load_scan",
+    "ShotCache",
+    "shot_cache",
     "write_fileheader",
     "write_traceheader",
     "write_block",
     "segy_write",
+    "SegyWriter",
+    "segy_patch_headers",
     "get_header",
     "plot_simage",
     "plot_velocity",
@@ -0,0 +1,226 @@
+"""
+Asynchronous readers fetching many byte ranges concurrently.
+
+Asynchronous fsspec filesystems created with ``asynchronous=True`` are
+awaited directly through ``_cat_file`` and ``_cat_ranges``. Local files and
+synchronous filesystems are read from worker threads.
+"""
+
+from io import BytesIO
+from typing import Iterable, List, Optional, Tuple
+import asyncio
+import os
+
+import numpy as np
+
+from .read import (
+    COALESCE_GAP,
+    empty_columns,
+    plan_segments,
+    read_fileheader,
+    scatter_traces,
+)
+from .types import FileHeader, SeisBlock, TH_BYTE2SAMPLE, TraceHeaderTable
+from .utils import trace_dtype
+
+# Largest byte range fetched by a single request
+REQUEST_BYTES = 1 << 20
+
+# Number of requests kept in flight at once
+MAX_CONCURRENCY = 32
+
+
+def _is_async(fs) -> bool:
+    return bool(
+        fs is not None
+        and getattr(fs, "async_impl", False)
+        and getattr(fs, "asynchronous", False)
+    )
+
+
+async def cat_ranges(
+    path: str,
+    starts: List[int],
+    ends: List[int],
+    fs=None,
+    max_concurrency: int = MAX_CONCURRENCY,
+) -> List[bytes]:
+    """
+    Fetch the byte ranges ``starts[i]:ends[i]`` of ``path`` concurrently.
+    """
+    if _is_async(fs):
+        return await fs._cat_ranges(
+            [path] * len(starts), starts, ends,
+            batch_size=max_concurrency, on_error="raise",
+        )
+
+    sem = asyncio.Semaphore(max_concurrency)
+
+    async def one(start: int, end: int) -> bytes:
+        async with sem:
+            return await cat_range(path, start, end, fs)
+
+    return list(await asyncio.gather(*(one(s, e) for s, e in zip(starts, ends))))
+
+
+async def cat_range(path: str, start: int, end: int, fs=None) -> bytes:
+    """
+    Fetch the byte range ``start:end`` of ``path``.
+    """
+    if _is_async(fs):
+        return await fs._cat_file(path, start=start, end=end)
+
+    def read_one() -> bytes:
+        if fs is not None:
+            return fs.cat_file(path, start=start, end=end)
+        with open(path, "rb") as f:
+            f.seek(start)
+            return f.read(end - start)
+
+    return await asyncio.to_thread(read_one)
+
+
+async def _size(path: str, fs=None) -> int:
+    if fs is None:
+        return os.path.getsize(path)
+    if _is_async(fs):
+        return int(await fs._size(path))
+    return int(await asyncio.to_thread(fs.size, path))
+
+
+def _split_plan(
+    plan: List[Tuple[int, int, np.ndarray, np.ndarray]],
+    trace_size: int,
+    max_request: int,
+) -> List[Tuple[int, int, np.ndarray, np.ndarray]]:
+    """
+    Split the reads of ``plan`` into requests of at most ``max_request`` bytes.
+    """
+    per = max(1, max_request // trace_size)
+    out = []
+    for start, ntraces, rows, cols in plan:
+        if ntraces <= per:
+            out.append((start, ntraces, rows, cols))
+            continue
+        # Group the traces by request with one stable sort
+        bins = rows // per
+        order = np.argsort(bins, kind="stable")
+        rows, cols, bins = rows[order], cols[order], bins[order]
+        edges = np.flatnonzero(np.diff(bins)) + 1
+        for a, b in zip([0, *edges.tolist()], [*edges.tolist(), len(rows)]):
+            r = rows[a:b]
+            lo, hi = int(r.min()), int(r.max()) + 1
+            out.append((start + lo * trace_size, hi - lo, r - lo, cols[a:b]))
+    return out
+
+
+async def aread_segments(
+    path: str,
+    segments: Iterable[Tuple[int, int]],
+    ns: int,
+    datatype: int,
+    keys: Optional[Iterable[str]] = None,
+    fs=None,
+    bigendian: bool = True,
+    max_gap: int = COALESCE_GAP,
+    max_request: int = REQUEST_BYTES,
+    max_concurrency: int = MAX_CONCURRENCY,
+) -> Tuple[TraceHeaderTable, np.ndarray]:
+    """
+    Asynchronous counterpart of :func:`~pysegy.read.read_segments`.
+
+    Coalesced reads are split into requests of at most ``max_request``
+    bytes, up to ``max_concurrency`` of which are in flight at once. Each
+    range is decoded as soon as it arrives, so only the ranges in flight
+    are held as raw bytes.
+
+    Returns
+    -------
+    tuple
+        ``(headers, data)`` with traces in the order of ``segments``.
+    """
+    segments = list(segments)
+    if keys is None:
+        keys = list(TH_BYTE2SAMPLE.keys())
+    key_list = list(dict.fromkeys(keys))
+    trace_size = 240 + ns * 4
+    dtype = trace_dtype(ns, datatype, tuple(key_list), bigendian)
+    total = sum(max(c, 0) for _, c in segments)
+
+    plan = _split_plan(
+        plan_segments(segments, trace_size, max_gap), trace_size, max_request
+    )
+    columns = empty_columns(dtype, key_list, total)
+    data: np.ndarray = np.empty((ns, total), dtype=np.float32)
+    sem = asyncio.Semaphore(max_concurrency)
+
+    async def fetch(start: int, n: int, rows: np.ndarray, cols: np.ndarray) -> None:
+        async with sem:
+            raw = await cat_range(path, start, start + n * trace_size, fs)
+        scatter_traces(raw, dtype, rows, cols, datatype, columns, data)
+
+    await asyncio.gather(*(fetch(*p) for p in plan))
+    return TraceHeaderTable(columns, total), data
+
+
+async def aread_fileheader(
+    path: str, fs=None, keys: Optional[Iterable[str]] = None, bigendian: bool = True
+) -> FileHeader:
+    """
+    Asynchronously read the file header of ``path``.
+    """
+    raw = (await cat_ranges(path, [0], [3600], fs))[0]
+    return read_fileheader(BytesIO(raw), keys, bigendian)
+
+
+async def asegy_read(
+    path: str,
+    keys: Optional[Iterable[str]] = None,
+    fs=None,
+    max_request: int = REQUEST_BYTES,
+    max_concurrency: int = MAX_CONCURRENCY,
+) -> SeisBlock:
+    """
+    Asynchronously read a complete SEGY file.
+
+    Parameters
+    ----------
+    path : str
+        File system path to the SEGY file. When ``fs`` is provided the
+        path is interpreted relative to that filesystem.
+    keys : Iterable[str], optional
+        Header fields to load with each trace.
+    fs : filesystem-like object, optional
+        fsspec filesystem holding the file. Asynchronous filesystems
+        created with ``asynchronous=True`` are used natively.
+    max_request : int, optional
+        Largest byte range fetched by one request.
+    max_concurrency : int, optional
+        Number of requests in flight at once.
+
+    Returns
+    -------
+    SeisBlock
+        Loaded dataset.
+    """
+    print(f"Reading SEGY file {path}")
+    fh, size = await asyncio.gather(aread_fileheader(path, fs), _size(path, fs))
+    ns = fh.bfh.ns
+    ntraces = (size - 3600) // (240 + ns * 4)
+    headers, data = await aread_segments(
+        path,
+        [(3600, ntraces)],
+        ns,
+        fh.bfh.DataSampleFormat,
+        keys,
+        fs,
+        max_request=max_request,
+        max_concurrency=max_concurrency,
+    )
+    print(f"Loaded header ns={ns} dt={fh.bfh.dt} from {path}")
+    return SeisBlock(fh, headers, data)
+
+
+__all__ = [
+    "asegy_read", "aread_segments", "aread_fileheader", "cat_range", "cat_ranges"
+]
@@ -0,0 +1,181 @@
+"""
+Memory-bounded LRU cache shared by the lazy shot readers.
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Tuple
+import os
+import threading
+
+import numpy as np
+
+
+def _nbytes(value: Any) -> int:
+    """
+    Approximate memory held by ``value`` in bytes.
+    """
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, dict):
+        return sum(_nbytes(v) for v in value.values())
+    if isinstance(value, (tuple, list)):
+        return sum(_nbytes(v) for v in value)
+    columns = getattr(value, "columns", None)
+    if columns is not None:
+        return _nbytes(columns)
+    return 0
+
+
+def _freeze(value: Any) -> None:
+    """
+    Make the arrays held by ``value`` read-only so cached entries stay intact.
+    """
+    if isinstance(value, np.ndarray):
+        value.flags.writeable = False
+    elif isinstance(value, dict):
+        for v in value.values():
+            _freeze(v)
+    elif isinstance(value, (tuple, list)):
+        for v in value:
+            _freeze(v)
+    elif getattr(value, "columns", None) is not None:
+        _freeze(value.columns)
+
+
+class ShotCache:
+    """
+    Thread-safe least recently used cache bounded by memory.
+
+    Cached arrays are made read-only; copy them before modifying.
+
+    Parameters
+    ----------
+    max_bytes : int, optional
+        Memory budget in bytes. ``0`` disables caching.
+    """
+
+    def __init__(self, max_bytes: int = 1 << 30) -> None:
+        self.max_bytes = int(max_bytes)
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Hashable, Tuple[Any, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Return the cached value for ``key`` and mark it recently used.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any) -> Any:
+        """
+        Store ``value`` under ``key``, evicting old entries to fit the budget.
+
+        Values larger than the whole budget are returned without caching.
+        Either way their arrays are made read-only, so the result of
+        :meth:`get_or_load` behaves the same whatever its size.
+        """
+        size = _nbytes(value)
+        _freeze(value)
+        if size > self.max_bytes:
+            return value
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.nbytes -= old[1]
+            self._entries[key] = (value, size)
+            self.nbytes += size
+            self._evict(self.max_bytes)
+        return value
+
+    def get_or_load(self, key: Hashable, load: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for ``key``, calling ``load`` on a miss.
+        """
+        sentinel = object()
+        value = self.get(key, sentinel)
+        if value is sentinel:
+            value = self.put(key, load())
+        return value
+
+    def invalidate(self, path: str) -> int:
+        """
+        Drop the entries read from ``path``, e.g. after the file was modified.
+
+        Entries are matched on keys of the form ``(kind, path, ...)`` used by
+        the shot readers. Returns the number of entries dropped.
+        """
+        target = os.path.abspath(path)
+        with self._lock:
+            stale = [
+                k for k in self._entries
+                if isinstance(k, tuple) and len(k) > 1 and isinstance(k[1], str)
+                and os.path.abspath(k[1]) == target
+            ]
+            for k in stale:
+                self.nbytes -= self._entries.pop(k)[1]
+        return len(stale)
+
+    def _evict(self, limit: int) -> None:
+        while self._entries and self.nbytes > limit:
+            _, (_, size) = self._entries.popitem(last=False)
+            self.nbytes -= size
+            self.evictions += 1
+
+    def resize(self, max_bytes: int) -> None:
+        """
+        Change the memory budget, evicting entries that no longer fit.
+        """
+        with self._lock:
+            self.max_bytes = int(max_bytes)
+            self._evict(self.max_bytes)
+
+    def clear(self) -> None:
+        """
+        Drop all entries and reset the counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+        Hit, miss and eviction counters with the current size.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "nbytes": self.nbytes,
+            "max_bytes": self.max_bytes,
+        }
+
+    def __str__(self) -> str:
+        lines = ["ShotCache:"]
+        for k, v in self.stats.items():
+            lines.append(f"    {k}: {v}")
+        return "\n".join(lines)
+
+    __repr__ = __str__
+
+
+# Cache shared by ShotRecord.data and SegyScan.read_data
+shot_cache = ShotCache()
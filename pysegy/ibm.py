@@ -2,9 +2,14 @@
 Conversion helpers between IBM and IEEE floating point formats.
 """
 
-from typing import Union
+from typing import Optional, Union
+import math
 import numpy as np
 
+# IBM has no infinity or NaN: infinities and overflows saturate to the
+# largest magnitude with the sign kept, NaN and underflows encode as zero.
+IBM_MAX = 0x7FFFFFFF
+
 
 def ibm_to_ieee(value: Union[bytes, bytearray, int]) -> float:
     """
@@ -36,17 +41,64 @@ def ibm_to_ieee(value: Union[bytes, bytearray, int]) -> float:
     return sign * mant * 16 ** (exponent - 64)
 
 
-def ibm_to_ieee_array(buf: bytes, count: int, bigendian: bool = True) -> np.ndarray:
-    """Vectorized conversion of ``count`` IBM floats contained in ``buf``."""
-    dtype = ">u4" if bigendian else "<u4"
-    vals = np.frombuffer(buf, dtype=dtype, count=count)
-    sign = np.where(vals >> 31 == 0, 1.0, -1.0)
-    exponent = (vals >> 24) & 0x7F
-    fraction = vals & 0x00FFFFFF
-    mant = fraction.astype(np.float64) / float(0x01000000)
-    out = sign * mant * np.power(16.0, exponent.astype(np.float64) - 64)
-    out[vals == 0] = 0.0
-    return out.astype(np.float32)
+def ibm_to_ieee_array(
+    buf: Union[bytes, bytearray, np.ndarray],
+    count: int = -1,
+    bigendian: bool = True,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Vectorized conversion of IBM floats to ``float32``.
+
+    Parameters
+    ----------
+    buf : bytes or numpy.ndarray
+        Either a buffer holding ``count`` IBM words or an array of raw 32-bit
+        words of any shape and strides, e.g. the samples of a whole chunk of
+        traces viewed in place.
+    count : int, optional
+        Number of words to read from a buffer; ``-1`` reads all of them.
+    bigendian : bool, optional
+        Byte order of the words when ``buf`` is a buffer.
+    out : numpy.ndarray, optional
+        ``float32`` array with the shape of the input receiving the result.
+
+    Returns
+    -------
+    numpy.ndarray
+        Converted values, ``out`` when it was provided.
+
+    Notes
+    -----
+    The conversion works on the integer bit patterns and only needs one
+    ``uint32`` scratch array besides the output. The 24-bit fraction is exact
+    in single precision and is scaled with :func:`numpy.ldexp`, which rounds
+    overflowing and denormal results exactly like a cast from the exact
+    double precision value.
+    """
+    if isinstance(buf, np.ndarray):
+        vals = buf
+    else:
+        dtype = ">u4" if bigendian else "<u4"
+        vals = np.frombuffer(buf, dtype=dtype, count=count)
+    if out is None:
+        out = np.empty(vals.shape, dtype=np.float32)
+
+    scratch = np.bitwise_and(vals, np.uint32(0x00FFFFFF), dtype=np.uint32)
+    out[...] = scratch
+    # Base-16 exponent biased by 64 applied to a fraction scaled by 2**24
+    np.right_shift(vals, np.uint32(24), out=scratch)
+    scratch &= np.uint32(0x7F)
+    expo = scratch.view(np.int32)
+    expo <<= 2
+    expo -= 280
+    with np.errstate(over="ignore", under="ignore"):
+        np.ldexp(out, expo, out=out)
+    # Copy the sign bit over unchanged
+    np.bitwise_and(vals, np.uint32(0x80000000), out=scratch)
+    bits = out.view(np.uint32)
+    bits |= scratch
+    return out
 
 
 def ieee_to_ibm(f: float) -> bytes:
@@ -61,21 +113,67 @@ def ieee_to_ibm(f: float) -> bytes:
     Returns
     -------
     bytes
-        The value encoded using the IBM format.
+        The value encoded using the IBM format. Infinities saturate to the
+        largest IBM magnitude and NaN is encoded as zero.
     """
-    if f == 0.0:
+    if f == 0.0 or math.isnan(f):
         return b"\x00\x00\x00\x00"
     sign = 0
     if f < 0:
         sign = 0x80
         f = -f
+    if math.isinf(f):
+        return ((sign << 24) | IBM_MAX).to_bytes(4, byteorder='big')
     exponent = 64
-    while f < 1.0:
+    # Normalise the fraction into [1/16, 1)
+    while f < 0.0625:
         f *= 16.0
         exponent -= 1
-    while f >= 16.0:
+    while f >= 1.0:
         f /= 16.0
         exponent += 1
+    if exponent > 127:
+        return ((sign << 24) | IBM_MAX).to_bytes(4, byteorder='big')
+    if exponent < 0:
+        return b"\x00\x00\x00\x00"
     fraction = int(f * 0x01000000) & 0x00ffffff
     val = (sign << 24) | (exponent << 24) | fraction
     return val.to_bytes(4, byteorder='big')
+
+
+def ieee_to_ibm_array(data: np.ndarray, bigendian: bool = True) -> np.ndarray:
+    """
+    Vectorized conversion of IEEE floats to IBM 32-bit words.
+
+    Parameters
+    ----------
+    data : numpy.ndarray
+        Values to encode, of any shape. Double precision input is encoded
+        from its full mantissa, anything else is taken as ``float32``.
+    bigendian : bool, optional
+        Byte order of the returned words.
+
+    Returns
+    -------
+    numpy.ndarray
+        ``uint32`` words with the shape of ``data``, identical to what
+        :func:`ieee_to_ibm` produces for every value, including the
+        saturated infinities and zero-encoded NaN.
+    """
+    vals = np.asarray(data)
+    if vals.dtype != np.float64:
+        vals = vals.astype(np.float32, copy=False)
+    finite = np.isfinite(vals)
+    mant, expo = np.frexp(np.where(finite, vals, 0))
+    # value = mant * 2**expo with |mant| in [0.5, 1); IBM needs a fraction in
+    # [1/16, 1) times a power of 16, so round the exponent up to a multiple
+    # of 4 and shift the mantissa right by the difference.
+    hexpo = -np.floor_divide(-expo, 4)
+    shift = 24 - (4 * hexpo - expo)
+    biased = hexpo.astype(np.int64) + 64
+    words = np.ldexp(np.abs(mant), shift).astype(np.uint32)
+    words |= (biased & 0x7F).astype(np.uint32) << np.uint32(24)
+    words[(biased > 127) | np.isinf(vals)] = IBM_MAX
+    words |= np.signbit(vals).astype(np.uint32) << np.uint32(31)
+    words[(vals == 0) | np.isnan(vals) | (biased < 0)] = 0
+    return words.astype(">u4" if bigendian else "<u4", copy=False)
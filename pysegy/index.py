@@ -0,0 +1,301 @@
+"""
+Persistent columnar index for :class:`SegyScan` objects.
+
+A saved scan is a directory holding an ``index.json`` manifest and one
+``.npy`` file per column:
+
+``coords``
+    ``(nshots, 3)`` gather coordinates.
+``file``, ``fileheader``, ``kind``, ``ns``, ``dt``
+    Per-shot indices into the ``paths``, ``fileheaders`` and ``kinds``
+    tables of the manifest, and sampling of every shot.
+``seg_ptr``, ``seg_offset``, ``seg_count``
+    Trace segments in compressed sparse row layout: the segments of shot
+    ``i`` are ``seg_ptr[i]:seg_ptr[i + 1]``.
+``summary_<key>``
+    ``(nshots, 2)`` minimum and maximum of every summarised header.
+
+File headers are stored once per distinct header and the manifest keeps
+the size and modification time of every scanned file for incremental
+rescans. Loading never unpickles
+anything, local indexes are memory-mapped and shot records are only built
+when accessed.
+"""
+
+import base64
+import json
+import os
+from collections.abc import Sequence
+from typing import Dict, List
+
+import cloudpickle
+import numpy as np
+
+from .scan import SegyScan, ShotRecord
+from .types import BinaryFileHeader, FileHeader
+from .utils import open_file
+
+INDEX_FORMAT = "pysegy-scan-index"
+INDEX_VERSION = 1
+
+
+def _fileheader_to_json(fh: FileHeader) -> dict:
+    return {
+        "th": base64.b64encode(fh.th).decode("ascii"),
+        "values": dict(fh.bfh.values),
+        "keys_loaded": list(fh.bfh.keys_loaded),
+    }
+
+
+def _fileheader_from_json(entry: dict) -> FileHeader:
+    bfh = BinaryFileHeader(dict(entry["values"]), list(entry["keys_loaded"]))
+    return FileHeader(base64.b64decode(entry["th"]), bfh)
+
+
+def _fileheader_key(fh: FileHeader) -> tuple:
+    return fh.th, tuple(fh.bfh.values.items())
+
+
+class _IndexedRecords(Sequence):
+    """
+    Read-only sequence of :class:`ShotRecord` built lazily from index columns.
+    """
+
+    def __init__(
+        self,
+        meta: dict,
+        arrays: Dict[str, np.ndarray],
+        fileheaders: List[FileHeader],
+        fs=None,
+    ) -> None:
+        self.meta = meta
+        self.arrays = arrays
+        self.fileheaders = fileheaders
+        self.fs = fs
+        self.coordinates = arrays["coords"]
+        self._cache: Dict[int, ShotRecord] = {}
+
+    def __len__(self) -> int:
+        return len(self.coordinates)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+        idx = int(idx)
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError("shot index out of range")
+        rec = self._cache.get(idx)
+        if rec is None:
+            rec = self._build(idx)
+            self._cache[idx] = rec
+        return rec
+
+    def _build(self, idx: int) -> ShotRecord:
+        a = self.arrays
+        lo, hi = int(a["seg_ptr"][idx]), int(a["seg_ptr"][idx + 1])
+        segments = list(
+            zip(a["seg_offset"][lo:hi].tolist(), a["seg_count"][lo:hi].tolist())
+        )
+        summary = {
+            k: tuple(a[f"summary_{k}"][idx].tolist())
+            for k in self.meta["summary_keys"]
+        }
+        depth_key, rec_depth_key, by_receiver = self.meta["kinds"][
+            int(a["kind"][idx])
+        ]
+        return ShotRecord(
+            self.meta["paths"][int(a["file"][idx])],
+            tuple(self.coordinates[idx]),
+            self.fileheaders[int(a["fileheader"][idx])],
+            rec_depth_key,
+            depth_key,
+            by_receiver,
+            segments,
+            summary,
+            int(a["ns"][idx]),
+            int(a["dt"][idx]),
+            self.fs,
+        )
+
+
+def _scan_columns(scan: SegyScan) -> tuple:
+    """
+    Flatten ``scan`` into the manifest and the column arrays of the index.
+    """
+    records = list(scan.records)
+    paths: Dict[str, int] = {}
+    fhs: Dict[tuple, int] = {}
+    fh_list: List[FileHeader] = []
+    kinds: Dict[tuple, int] = {}
+
+    def fh_index(fh: FileHeader) -> int:
+        key = _fileheader_key(fh)
+        if key not in fhs:
+            fhs[key] = len(fh_list)
+            fh_list.append(fh)
+        return fhs[key]
+
+    summary_keys = list(
+        dict.fromkeys(k for r in records for k in r.summary)
+    )
+    n = len(records)
+    file_idx = np.zeros(n, dtype=np.int32)
+    fh_idx = np.zeros(n, dtype=np.int32)
+    kind_idx = np.zeros(n, dtype=np.int32)
+    seg_ptr = np.zeros(n + 1, dtype=np.int64)
+    for i, r in enumerate(records):
+        file_idx[i] = paths.setdefault(r.path, len(paths))
+        fh_idx[i] = fh_index(r.fileheader)
+        kind = (r.depth_key, r.rec_depth_key, bool(r.by_receiver))
+        kind_idx[i] = kinds.setdefault(kind, len(kinds))
+        seg_ptr[i + 1] = seg_ptr[i] + len(r.segments)
+
+    segments = [s for r in records for s in r.segments]
+    arrays = {
+        "coords": np.array(
+            [r.coordinates for r in records], dtype=np.float32
+        ).reshape(n, 3),
+        "file": file_idx,
+        "fileheader": fh_idx,
+        "kind": kind_idx,
+        "ns": np.array([r.ns for r in records], dtype=np.int32),
+        "dt": np.array([r.dt for r in records], dtype=np.int32),
+        "seg_ptr": seg_ptr,
+        "seg_offset": np.array([o for o, _ in segments], dtype=np.int64),
+        "seg_count": np.array([c for _, c in segments], dtype=np.int64),
+    }
+    for k in summary_keys:
+        vals = np.array(
+            [r.summary.get(k, (np.nan, np.nan)) for r in records]
+        ).reshape(n, 2)
+        arrays[f"summary_{k}"] = vals
+
+    scan_fh = fh_index(scan.fileheader)
+    meta = {
+        "format": INDEX_FORMAT,
+        "version": INDEX_VERSION,
+        "nshots": n,
+        "paths": list(paths),
+        "fileheaders": [_fileheader_to_json(fh) for fh in fh_list],
+        "fileheader": scan_fh,
+        "kinds": [list(k) for k in kinds],
+        "summary_keys": summary_keys,
+        "columns": list(arrays),
+        "files": {f: list(stamp) for f, stamp in scan.file_info.items()},
+    }
+    return meta, arrays
+
+
+def save_scan(path: str, scan: SegyScan, fs=None) -> None:
+    """
+    Save ``scan`` as a columnar index directory at ``path``.
+
+    Parameters
+    ----------
+    path : str
+        Destination directory. When ``fs`` is provided the path is
+        interpreted relative to that filesystem.
+    scan : SegyScan
+        Object to serialize.
+    fs : filesystem-like object, optional
+        Filesystem providing ``open`` when writing to non-local storage.
+    """
+    print(f"Saving SegyScan to {path}")
+    meta, arrays = _scan_columns(scan)
+    if fs is None:
+        os.makedirs(path, exist_ok=True)
+    else:
+        fs.makedirs(path, exist_ok=True)
+    for name, arr in arrays.items():
+        with open_file(f"{path}/{name}.npy", "wb", fs) as f:
+            np.save(f, arr, allow_pickle=False)
+    # The manifest is written last so a partial index is never picked up
+    with open_file(f"{path}/index.json", "wb", fs) as f:
+        f.write(json.dumps(meta).encode("utf-8"))
+    print(f"Finished saving {path}")
+
+
+def load_scan(path: str, fs=None, allow_pickle: bool = False) -> SegyScan:
+    """
+    Load a :class:`SegyScan` previously saved with :func:`save_scan`.
+
+    Parameters
+    ----------
+    path : str
+        Index directory. When ``fs`` is provided the path is interpreted
+        relative to that filesystem.
+    fs : filesystem-like object, optional
+        Filesystem providing ``open`` when reading from non-local storage.
+    allow_pickle : bool, optional
+        Accept a legacy pickled scan file. Unpickling can execute arbitrary
+        code, so only enable this for trusted files.
+
+    Returns
+    -------
+    SegyScan
+        Scan whose records are built lazily from the memory-mapped columns.
+    """
+    print(f"Loading SegyScan from {path}")
+    isdir = fs.isdir(path) if fs is not None else os.path.isdir(path)
+    if not isdir:
+        if not allow_pickle:
+            raise ValueError(
+                f"{path} is not a scan index; pass allow_pickle=True to load "
+                "a legacy pickled scan from a trusted source"
+            )
+        scan = _load_pickled_scan(path, fs)
+        print(f"Loaded SegyScan with {len(scan.records)} shots")
+        return scan
+
+    with open_file(f"{path}/index.json", "rb", fs) as f:
+        meta = json.loads(f.read().decode("utf-8"))
+    if meta.get("format") != INDEX_FORMAT:
+        raise ValueError(f"{path} is not a pysegy scan index")
+    if meta["version"] > INDEX_VERSION:
+        raise ValueError(
+            f"Scan index version {meta['version']} is newer than the "
+            f"supported version {INDEX_VERSION}"
+        )
+
+    arrays: Dict[str, np.ndarray] = {}
+    for name in meta["columns"]:
+        fname = f"{path}/{name}.npy"
+        if fs is None:
+            arrays[name] = np.load(fname, mmap_mode="r", allow_pickle=False)
+        else:
+            with fs.open(fname, "rb") as f:
+                arrays[name] = np.load(f, allow_pickle=False)
+
+    fileheaders = [_fileheader_from_json(e) for e in meta["fileheaders"]]
+    records = _IndexedRecords(meta, arrays, fileheaders, fs)
+    file_info = {f: tuple(v) for f, v in meta.get("files", {}).items()}
+    scan = SegyScan(
+        fileheaders[meta["fileheader"]], records, fs=fs, file_info=file_info
+    )
+    print(f"Loaded SegyScan with {len(records)} shots")
+    return scan
+
+
+def _load_pickled_scan(path: str, fs=None) -> SegyScan:
+    """
+    Load a scan written by the former pickle-based :func:`save_scan`.
+    """
+    with open_file(path, "rb", fs) as f:
+        scan = cloudpickle.load(f)
+
+    # When loading from external storage the filesystem won't be part of the
+    # serialized object. Attach it so lazy reads work correctly.
+    if fs is not None:
+        scan.fs = fs
+        for rec in scan.records:
+            rec.fs = fs
+    # Attributes added to SegyScan after the pickle format was retired
+    for name, default in (("file_info", {}), ("filters", {}), ("_spatial", None)):
+        if not hasattr(scan, name):
+            setattr(scan, name, default)
+    return scan
+
+
+__all__ = ["save_scan", "load_scan"]
@@ -0,0 +1,164 @@
+"""
+Memory-mapped access to local SEGY files.
+"""
+
+from typing import Iterable, Optional, Union
+import mmap
+
+import numpy as np
+
+from .ibm import ibm_to_ieee_array
+from .read import read_fileheader
+from .types import SeisBlock, TraceHeaderTable, TH_FIELDS
+from .utils import trace_dtype
+
+
+class SegyMmap:
+    """
+    Zero-copy view of a SEGY file mapped into memory.
+
+    Trace headers and samples are exposed as strided NumPy views over the
+    mapping, so opening a file is instant and reading a trace only costs the
+    page faults needed to bring it in. IEEE samples are never copied; IBM
+    samples are decoded on access.
+
+    Parameters
+    ----------
+    path : str
+        Local path of the SEGY file.
+    bigendian : bool, optional
+        ``True`` when the file is big-endian.
+    writable : bool, optional
+        Map the file for writing so that assignments to header columns
+        update the file in place.
+    """
+
+    def __init__(
+        self, path: str, bigendian: bool = True, writable: bool = False
+    ) -> None:
+        self.path = path
+        self.bigendian = bigendian
+        self.writable = writable
+        access = mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ
+        with open(path, "r+b" if writable else "rb") as f:
+            self.fileheader = read_fileheader(f, bigendian=bigendian)
+            self._mmap = mmap.mmap(f.fileno(), 0, access=access)
+        self.ns = self.fileheader.bfh.ns
+        self.datatype = self.fileheader.bfh.DataSampleFormat
+        trace_size = 240 + self.ns * 4
+        self.ntraces = (len(self._mmap) - 3600) // trace_size
+        dtype = trace_dtype(
+            self.ns, self.datatype, tuple(TH_FIELDS), bigendian
+        )
+        self._traces = np.frombuffer(
+            self._mmap, dtype=dtype, count=self.ntraces, offset=3600
+        )
+
+    def __len__(self) -> int:
+        return self.ntraces
+
+    def __getitem__(self, idx: Union[int, slice, np.ndarray]) -> np.ndarray:
+        """
+        Return samples of the traces selected by ``idx``.
+
+        A single trace is returned as a vector of ``ns`` samples, any other
+        selection as an ``ns`` x ``ntraces`` array.
+        """
+        raw = self._traces["data"][idx]
+        if self.datatype == 1:
+            raw = ibm_to_ieee_array(raw)
+        return raw.T
+
+    @property
+    def traceheaders(self) -> TraceHeaderTable:
+        """
+        Table of all trace header fields as strided views of the file.
+
+        On a writable mapping the columns can be modified in place, e.g.
+        ``mm.traceheaders["SourceX"][:] = x``.
+        """
+        return TraceHeaderTable(
+            {k: self._traces[k] for k in TH_FIELDS}, self.ntraces
+        )
+
+    def flush(self) -> None:
+        """
+        Write modifications of a writable mapping back to the file.
+        """
+        if self.writable and self._traces is not None:
+            self._mmap.flush()
+
+    @property
+    def data(self) -> np.ndarray:
+        """
+        ``ns`` x ``ntraces`` array of samples for the whole file.
+        """
+        return self[:]
+
+    def to_block(self, keys: Optional[Iterable[str]] = None) -> SeisBlock:
+        """
+        Return the mapped file as a :class:`SeisBlock`.
+
+        Parameters
+        ----------
+        keys : Iterable[str], optional
+            Header fields exposed in the block; all are included by default.
+        """
+        if keys is None:
+            keys = TH_FIELDS
+        headers = TraceHeaderTable(
+            {k: self._traces[k] for k in keys}, self.ntraces
+        )
+        return SeisBlock(self.fileheader, headers, self.data)
+
+    def close(self) -> None:
+        """
+        Release the mapping once no array views reference it anymore.
+        """
+        self.flush()
+        self._traces = None
+        try:
+            self._mmap.close()
+        except BufferError:
+            # Views handed out earlier keep the mapping alive until collected
+            pass
+
+    def __enter__(self) -> "SegyMmap":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __str__(self) -> str:
+        lines = ["SegyMmap:"]
+        lines.append(f"    path: {self.path}")
+        lines.append(f"    traces: {self.ntraces}")
+        lines.append(f"    ns: {self.ns}")
+        lines.append(f"    dt: {self.fileheader.bfh.dt}")
+        return "\n".join(lines)
+
+    __repr__ = __str__
+
+
+def segy_mmap(
+    path: str, bigendian: bool = True, writable: bool = False
+) -> SegyMmap:
+    """
+    Map a local SEGY file into memory without reading it.
+
+    Parameters
+    ----------
+    path : str
+        Local path of the SEGY file.
+    bigendian : bool, optional
+        ``True`` when the file is big-endian.
+    writable : bool, optional
+        Allow modifying trace headers and samples in place.
+
+    Returns
+    -------
+    SegyMmap
+        Lazily paged view of the file.
+    """
+    print(f"Mapping SEGY file {path}")
+    return SegyMmap(path, bigendian, writable)
@@ -9,16 +9,87 @@ from .types import (
     SeisBlock,
     FH_BYTE2SAMPLE,
     TH_BYTE2SAMPLE,
+    TraceHeaderTable,
 )
-from typing import BinaryIO, Iterable, List, Optional, Tuple
+from typing import BinaryIO, Dict, Iterable, List, Optional, Tuple, Union
 import numpy as np
-from concurrent.futures import ThreadPoolExecutor
 
-from .utils import read_samples, unpack_int, open_file
+from .utils import (
+    decode_samples,
+    header_dtype,
+    native_columns,
+    open_file,
+    read_strided,
+    trace_dtype,
+    unpack_int,
+)
 
 # Number of traces to read at a time when loading an entire file
 TRACE_CHUNKSIZE = 512
 
+# Segments separated by fewer bytes than this are fetched with one read
+COALESCE_GAP = 64 * 1024
+
+
+def sample_window(
+    samples: Union[slice, Tuple[Optional[int], ...], None], ns: int
+) -> Tuple[int, slice, int]:
+    """
+    Resolve a ``(start, stop, step)`` sample selection for ``ns`` samples.
+
+    Returns
+    -------
+    tuple
+        ``(prefix, window, nout)``: the number of leading samples that must
+        be read from every trace, the slice selecting the wanted samples from
+        that prefix and the number of samples selected.
+    """
+    if samples is None:
+        return ns, slice(None), ns
+    if not isinstance(samples, slice):
+        samples = slice(*samples)
+    start, stop, step = samples.indices(ns)
+    if step <= 0:
+        raise ValueError("Sample windows must have a positive step")
+    nout = len(range(start, stop, step))
+    prefix = start + (nout - 1) * step + 1 if nout else 0
+    return prefix, slice(start, stop, step), nout
+
+
+def window_fileheader(fh: FileHeader, nout: int, step: int) -> FileHeader:
+    """
+    Return a copy of ``fh`` describing traces cut to a sample window.
+    """
+    bfh = BinaryFileHeader(dict(fh.bfh.values), list(fh.bfh.keys_loaded))
+    bfh.ns = nout
+    bfh.dt = fh.bfh.dt * step
+    return FileHeader(fh.th, bfh)
+
+
+def window_traceheaders(
+    table: TraceHeaderTable, window: slice, nout: int, dt: int
+) -> TraceHeaderTable:
+    """
+    Update the loaded ``ns``, ``dt`` and ``DelayRecordingTime`` columns of
+    ``table`` in place for traces cut to the sample ``window``.
+
+    ``dt`` is the sample interval of the file in microseconds, used for
+    traces without their own ``dt``. The recording delay, in milliseconds,
+    moves to the first selected sample.
+    """
+    loaded = set(table.keys_loaded)
+    trace_dt = table.column("dt").astype(np.int64)
+    trace_dt = np.where(trace_dt > 0, trace_dt, dt)
+    if "DelayRecordingTime" in loaded and window.start:
+        shift = np.round(window.start * trace_dt / 1000).astype(np.int64)
+        delay = table.column("DelayRecordingTime").astype(np.int64)
+        table["DelayRecordingTime"] = delay + shift
+    if "ns" in loaded:
+        table["ns"] = np.full(table.ntraces, nout)
+    if "dt" in loaded:
+        table["dt"] = table.column("dt").astype(np.int64) * window.step
+    return table
+
 
 def read_fileheader(
     f: BinaryIO, keys: Optional[Iterable[str]] = None, bigendian: bool = True
@@ -100,7 +171,8 @@ def read_traces(
     datatype: int,
     keys: Optional[Iterable[str]] = None,
     bigendian: bool = True,
-) -> Tuple[List[BinaryTraceHeader], List[List[float]]]:
+    samples: Union[slice, Tuple[Optional[int], ...], None] = None,
+) -> Tuple[TraceHeaderTable, np.ndarray]:
     """
     Read ``ntraces`` traces and their headers from ``f``.
 
@@ -118,54 +190,277 @@ def read_traces(
         Header fields to read for each trace.
     bigendian : bool, optional
         ``True`` for big-endian encoding.
+    samples : slice or tuple, optional
+        ``(start, stop, step)`` window of samples to return. Only the header
+        and the samples up to the last selected one are read per trace.
 
     Returns
     -------
     tuple
-        ``(headers, data)`` where ``headers`` is a list of
-        :class:`BinaryTraceHeader` and ``data`` is ``ns`` x ``ntraces`` array.
+        ``(headers, data)`` where ``headers`` is a
+        :class:`TraceHeaderTable` and ``data`` is ``ns`` x ``ntraces`` array,
+        or has one row per selected sample.
     """
-    data: np.ndarray = np.zeros((ns, ntraces), dtype=np.float32)
-    headers: List[BinaryTraceHeader] = [BinaryTraceHeader() for _ in range(ntraces)]
-
     trace_size = 240 + ns * 4
-    raw = f.read(trace_size * ntraces)
+    prefix, window, nout = sample_window(samples, ns)
+    if prefix == ns:
+        raw = f.read(trace_size * ntraces)
+    else:
+        start = f.tell()
+        raw = read_strided(f, start, ntraces, trace_size, 240 + prefix * 4)
+        f.seek(start + trace_size * ntraces)
 
     if keys is None:
         keys = list(TH_BYTE2SAMPLE.keys())
-    key_list = list(keys)
-
-    hdr_parsers = [
-        (k, TH_BYTE2SAMPLE[k][0], TH_BYTE2SAMPLE[k][1]) for k in key_list
-    ]
-
-    def parse_one(idx: int):
-        offset = idx * trace_size
-        hdr_buf = raw[offset:offset + 240]
-        hdr = BinaryTraceHeader()
-        for k, off_k, size_k in hdr_parsers:
-            val = unpack_int(hdr_buf[off_k:off_k + size_k], size_k, bigendian)
-            setattr(hdr, k, val)
-        hdr.keys_loaded = key_list
-
-        data_buf = raw[offset + 240:offset + trace_size]
-        samples = read_samples(data_buf, ns, datatype, bigendian)
-        return idx, hdr, samples
-
-    with ThreadPoolExecutor() as pool:
-        for idx, hdr, samples in pool.map(parse_one, range(ntraces)):
-            headers[idx] = hdr
-            data[:, idx] = samples
+    key_list = list(dict.fromkeys(keys))
+
+    # View the chunk as whole traces: headers and samples decode in one step
+    dtype = trace_dtype(prefix, datatype, tuple(key_list), bigendian)
+    rec = np.frombuffer(raw, dtype=dtype, count=ntraces)
+    headers = TraceHeaderTable(native_columns(rec, key_list), ntraces)
+    data: np.ndarray = np.empty((nout, ntraces), dtype=np.float32)
+    decode_samples(rec["data"][:, window], datatype, out=data.T)
 
     return headers, data
 
 
+def plan_segments(
+    segments: Iterable[Tuple[int, int]],
+    trace_size: int,
+    max_gap: int = COALESCE_GAP,
+) -> List[Tuple[int, int, np.ndarray, np.ndarray]]:
+    """
+    Merge ``(offset, count)`` trace segments into few contiguous reads.
+
+    Segments are sorted by offset and joined whenever the gap between them
+    is at most ``max_gap`` bytes. Output columns follow the order of
+    ``segments``.
+
+    Returns
+    -------
+    list of tuple
+        ``(start, ntraces, rows, cols)`` for every read: ``ntraces`` traces
+        are read from byte ``start`` and trace ``rows[j]`` of that read
+        belongs to output column ``cols[j]``.
+    """
+    segs = np.asarray(list(segments), dtype=np.int64).reshape(-1, 2)
+    first_col = np.cumsum(segs[:, 1]) - segs[:, 1]
+    groups: List[List[int]] = []
+    end = 0
+    for i in np.argsort(segs[:, 0], kind="stable").tolist():
+        offset, count = segs[i]
+        if count <= 0:
+            continue
+        if groups and offset - end <= max_gap:
+            groups[-1].append(i)
+            end = max(end, offset + count * trace_size)
+        else:
+            groups.append([i])
+            end = offset + count * trace_size
+
+    plan = []
+    for group in groups:
+        start = int(segs[group, 0].min())
+        stop = int((segs[group, 0] + segs[group, 1] * trace_size).max())
+        rows = np.concatenate([
+            (segs[i, 0] - start) // trace_size + np.arange(segs[i, 1])
+            for i in group
+        ])
+        cols = np.concatenate([
+            first_col[i] + np.arange(segs[i, 1]) for i in group
+        ])
+        plan.append((start, (stop - start) // trace_size, rows, cols))
+    return plan
+
+
+def _as_slice(idx: np.ndarray):
+    """
+    Return ``idx`` as a slice when it is a contiguous ascending range.
+    """
+    if len(idx) and idx[-1] - idx[0] + 1 == len(idx) and (
+        len(idx) == 1 or (np.diff(idx) == 1).all()
+    ):
+        return slice(int(idx[0]), int(idx[-1]) + 1)
+    return idx
+
+
+def read_segments(
+    f: BinaryIO,
+    segments: Iterable[Tuple[int, int]],
+    ns: int,
+    datatype: int,
+    keys: Optional[Iterable[str]] = None,
+    bigendian: bool = True,
+    max_gap: int = COALESCE_GAP,
+    samples: Union[slice, Tuple[Optional[int], ...], None] = None,
+) -> Tuple[TraceHeaderTable, np.ndarray]:
+    """
+    Read the traces of several ``(offset, count)`` segments of one file.
+
+    Near-adjacent segments are coalesced into single reads with
+    :func:`plan_segments` and decoded into one preallocated array.
+
+    Parameters
+    ----------
+    f : BinaryIO
+        Open binary file handle.
+    segments : Iterable[Tuple[int, int]]
+        Byte offset of the first trace and number of traces per segment.
+    ns : int
+        Number of samples per trace.
+    datatype : int
+        SEGY data sample format code.
+    keys : Iterable[str], optional
+        Header fields to read for each trace.
+    bigendian : bool, optional
+        ``True`` for big-endian encoding.
+    max_gap : int, optional
+        Largest gap in bytes read through to join two segments.
+    samples : slice or tuple, optional
+        ``(start, stop, step)`` window of samples to return, see
+        :func:`read_traces`.
+
+    Returns
+    -------
+    tuple
+        ``(headers, data)`` with traces in the order of ``segments``.
+    """
+    segments = list(segments)
+    if keys is None:
+        keys = list(TH_BYTE2SAMPLE.keys())
+    key_list = list(dict.fromkeys(keys))
+    trace_size = 240 + ns * 4
+    prefix, window, nout = sample_window(samples, ns)
+    dtype = trace_dtype(prefix, datatype, tuple(key_list), bigendian)
+    total = sum(max(c, 0) for _, c in segments)
+
+    columns = empty_columns(dtype, key_list, total)
+    data: np.ndarray = np.empty((nout, total), dtype=np.float32)
+    for start, ntraces, rows, cols in plan_segments(
+        segments, trace_size, max_gap
+    ):
+        if prefix == ns:
+            f.seek(start)
+            raw = f.read(trace_size * ntraces)
+        else:
+            raw = read_strided(f, start, ntraces, trace_size, 240 + prefix * 4)
+        scatter_traces(raw, dtype, rows, cols, datatype, columns, data, window)
+    return TraceHeaderTable(columns, total), data
+
+
+def empty_columns(
+    dtype: np.dtype, keys: Iterable[str], ntraces: int
+) -> Dict[str, np.ndarray]:
+    """
+    Allocate native-endian header columns for the fields ``keys`` of ``dtype``.
+    """
+    return {
+        k: np.empty(ntraces, dtype=dtype.fields[k][0].newbyteorder("="))
+        for k in keys
+    }
+
+
+def scatter_traces(
+    raw: bytes,
+    dtype: np.dtype,
+    rows: np.ndarray,
+    cols: np.ndarray,
+    datatype: int,
+    columns: Dict[str, np.ndarray],
+    data: np.ndarray,
+    window: slice = slice(None),
+) -> None:
+    """
+    Decode traces ``rows`` of ``raw`` into columns ``cols`` of the outputs.
+
+    ``raw`` holds whole traces laid out as ``dtype``, ``columns`` maps header
+    keys to preallocated arrays and ``data`` receives the samples selected
+    by ``window`` as one column per trace.
+    """
+    rec = np.frombuffer(raw, dtype=dtype)[_as_slice(rows)]
+    cols = _as_slice(cols)
+    for k, col in columns.items():
+        col[cols] = rec[k]
+    samples = rec["data"][:, window]
+    if isinstance(cols, slice):
+        decode_samples(samples, datatype, out=data[:, cols].T)
+    else:
+        data[:, cols] = decode_samples(samples, datatype).T
+
+
+def read_segment_headers(
+    f: BinaryIO,
+    segments: Iterable[Tuple[int, int]],
+    ns: int,
+    keys: Optional[Iterable[str]] = None,
+    bigendian: bool = True,
+    max_gap: int = COALESCE_GAP,
+) -> TraceHeaderTable:
+    """
+    Read only the trace headers of several ``(offset, count)`` segments.
+
+    Segments are coalesced like in :func:`read_segments` and the samples
+    in between headers are skipped with :func:`~pysegy.utils.read_strided`.
+    """
+    segments = list(segments)
+    if keys is None:
+        keys = list(TH_BYTE2SAMPLE.keys())
+    key_list = list(dict.fromkeys(keys))
+    trace_size = 240 + ns * 4
+    total = sum(max(c, 0) for _, c in segments)
+
+    dtype = header_dtype(tuple(key_list), bigendian)
+    columns = empty_columns(dtype, key_list, total)
+    for start, ntraces, rows, cols in plan_segments(
+        segments, trace_size, max_gap
+    ):
+        raw = read_strided(f, start, ntraces, trace_size, 240)
+        rec = np.frombuffer(raw, dtype=dtype)[_as_slice(rows)]
+        cols = _as_slice(cols)
+        for k in key_list:
+            columns[k][cols] = rec[k]
+    return TraceHeaderTable(columns, total)
+
+
+def trace_runs(
+    traces, ntraces: int, trace_size: int
+) -> List[Tuple[int, int]]:
+    """
+    Group selected trace numbers into ``(offset, count)`` segments.
+
+    ``traces`` holds trace numbers, negative ones counting from the end, or
+    a boolean mask over all ``ntraces`` traces. Consecutive numbers in the
+    requested order form one segment.
+    """
+    sel = np.asarray(traces)
+    if sel.dtype == bool:
+        if sel.shape != (ntraces,):
+            raise IndexError(
+                f"Boolean mask of length {len(sel)} for {ntraces} traces"
+            )
+        idx = np.flatnonzero(sel)
+    else:
+        idx = sel.astype(np.int64).reshape(-1)
+        idx = np.where(idx < 0, idx + ntraces, idx)
+        if len(idx) and (idx.min() < 0 or idx.max() >= ntraces):
+            raise IndexError(f"Trace numbers out of range for {ntraces} traces")
+    if not len(idx):
+        return []
+    starts = np.flatnonzero(np.diff(idx, prepend=idx[0] - 2) != 1)
+    counts = np.diff(np.append(starts, len(idx)))
+    offsets = 3600 + idx[starts] * trace_size
+    return list(zip(offsets.tolist(), counts.tolist()))
+
+
 def read_file(
     f: BinaryIO,
     warn_user: bool = True,
     keys: Optional[Iterable[str]] = None,
     bigendian: bool = True,
     workers: int = 5,
+    samples: Union[slice, Tuple[Optional[int], ...], None] = None,
+    traces: Optional[np.ndarray] = None,
+    max_gap: int = COALESCE_GAP,
 ) -> SeisBlock:
     """
     Read a complete SEGY file from an open file handle.
@@ -182,6 +477,15 @@ def read_file(
         Set ``True`` for big-endian encoding.
     workers : int, optional
         Unused parameter kept for backwards compatibility.
+    samples : slice or tuple, optional
+        ``(start, stop, step)`` window of samples to read from every trace.
+        The file header and the loaded ``ns``, ``dt`` and
+        ``DelayRecordingTime`` trace header fields describe the window.
+    traces : array-like, optional
+        Trace numbers or a boolean mask over all traces selecting the traces
+        to read, returned in the requested order.
+    max_gap : int, optional
+        Largest gap in bytes read through to join two runs of ``traces``.
 
     Returns
     -------
@@ -197,21 +501,38 @@ def read_file(
     end = f.tell()
     ntraces = (end - 3600) // trace_size
     f.seek(3600)
-    headers: List[BinaryTraceHeader] = [BinaryTraceHeader() for _ in range(ntraces)]
-    data: np.ndarray = np.zeros((ns, ntraces), dtype=np.float32)
+    _, window, nout = sample_window(samples, ns)
+    if samples is not None:
+        fh_out = window_fileheader(fh, nout, window.step)
+    else:
+        fh_out = fh
+
+    if traces is not None:
+        segments = trace_runs(traces, ntraces, trace_size)
+        headers, data = read_segments(
+            f, segments, ns, dsf, keys, bigendian, max_gap, samples
+        )
+        if samples is not None:
+            window_traceheaders(headers, window, nout, fh.bfh.dt)
+        return SeisBlock(fh_out, headers, data)
+
+    tables: List[TraceHeaderTable] = []
+    data: np.ndarray = np.zeros((nout, ntraces), dtype=np.float32)
 
     idx = 0
     while idx < ntraces:
         count = min(TRACE_CHUNKSIZE, ntraces - idx)
         h, d = read_traces(
-            f, ns, count, dsf, keys, bigendian
+            f, ns, count, dsf, keys, bigendian, samples
         )
-        for j in range(count):
-            headers[idx + j] = h[j]
-            data[:, idx + j] = d[:, j]
+        tables.append(h)
+        data[:, idx:idx + count] = d
         idx += count
 
-    return SeisBlock(fh, headers, data)
+    headers = TraceHeaderTable.concatenate(tables)
+    if samples is not None:
+        window_traceheaders(headers, window, nout, fh.bfh.dt)
+    return SeisBlock(fh_out, headers, data)
 
 
 def segy_read(
@@ -219,6 +540,9 @@ def segy_read(
     keys: Optional[Iterable[str]] = None,
     workers: int = 5,
     fs=None,
+    samples: Union[slice, Tuple[Optional[int], ...], None] = None,
+    traces: Optional[np.ndarray] = None,
+    max_gap: int = COALESCE_GAP,
 ) -> SeisBlock:
     """
     Convenience wrapper to read a SEGY file.
@@ -232,6 +556,15 @@ def segy_read(
         Filesystem providing ``open`` if reading from non-local storage.
     keys : Iterable[str], optional
         Additional header fields to load with each trace.
+    samples : slice or tuple, optional
+        ``(start, stop, step)`` window of samples to read from every trace.
+    traces : array-like, optional
+        Trace numbers or a boolean mask selecting the traces to read. Runs
+        of consecutive traces are read together, runs closer than
+        ``max_gap`` bytes are coalesced, and the traces are returned in
+        the requested order.
+    max_gap : int, optional
+        Largest gap in bytes read through to join two runs of ``traces``.
 
     Returns
     -------
@@ -241,7 +574,14 @@ def segy_read(
     print(f"Reading SEGY file {path}")
 
     with open_file(path, "rb", fs) as f:
-        block = read_file(f, keys=keys, workers=workers)
+        block = read_file(
+            f,
+            keys=keys,
+            workers=workers,
+            samples=samples,
+            traces=traces,
+            max_gap=max_gap,
+        )
     print(
         f"Loaded header ns={block.fileheader.bfh.ns} "
         f"dt={block.fileheader.bfh.dt} from {path}"
@@ -2,24 +2,61 @@
 Helpers for scanning SEGY files by shot location.
 """
 
-from typing import Any, Dict, Iterable, List, Optional, Tuple
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+from collections import deque
+from collections.abc import Sequence
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from contextlib import nullcontext
 import os
 import threading
 
 import fnmatch
 from dataclasses import dataclass, field
-import struct
 import numpy as np
-import cloudpickle
 
-from .read import read_fileheader, read_traceheader, read_traces
-from .utils import get_header, open_file
+from .read import (
+    empty_columns,
+    plan_segments,
+    read_fileheader,
+    read_segment_headers,
+    read_segments,
+    sample_window,
+    scatter_traces,
+    window_fileheader,
+    window_traceheaders,
+)
+from .aio import aread_segments
+from .cache import shot_cache
+from .spatial import GridIndex, morton_order
+from .utils import (
+    _check_scale,
+    get_header,
+    open_file,
+    read_strided,
+    trace_dtype,
+    unpack_headers,
+)
 from .types import (
     SeisBlock,
     FileHeader,
     BinaryTraceHeader,
     TH_BYTE2SAMPLE,
+    TraceHeaderTable,
 )
 
 
@@ -40,7 +77,6 @@ class ShotRecord:
     ns: int = 0
     dt: int = 0
     fs: Any = field(default=None, repr=False)
-    _data: Optional[np.ndarray] = field(default=None, init=False, repr=False)
     _headers: Optional[List[BinaryTraceHeader]] = field(
         default=None, init=False, repr=False
     )
@@ -67,23 +103,27 @@ class ShotRecord:
 
     __repr__ = __str__
 
-    def read_data(self, keys: Optional[Iterable[str]] = None) -> SeisBlock:
+    def read_data(
+        self,
+        keys: Optional[Iterable[str]] = None,
+        samples: Union[slice, Tuple[Optional[int], ...], None] = None,
+    ) -> np.ndarray:
         """
         Load all traces for this shot.
+
+        ``samples`` selects a ``(start, stop, step)`` window of samples; only
+        the bytes up to the last selected sample of each trace are read.
         """
-        data_parts = []
-        for offset, count in self.segments:
-            with open_file(self.path, "rb", self.fs) as f:
-                f.seek(offset)
-                _, d = read_traces(
-                    f,
-                    self.fileheader.bfh.ns,
-                    count,
-                    self.fileheader.bfh.DataSampleFormat,
-                    keys,
-                )
-                data_parts.append(d)
-        return np.concatenate(data_parts, axis=1) if data_parts else []
+        with open_file(self.path, "rb", self.fs) as f:
+            _, data = read_segments(
+                f,
+                self.segments,
+                self.fileheader.bfh.ns,
+                self.fileheader.bfh.DataSampleFormat,
+                keys,
+                samples=samples,
+            )
+        return data
 
     def read_headers(
         self, keys: Optional[Iterable[str]] = None
@@ -91,22 +131,45 @@ class ShotRecord:
         """
         Read only the headers for this shot.
         """
-        headers: List[BinaryTraceHeader] = []
-        ns = self.fileheader.bfh.ns
-        for offset, count in self.segments:
-            with open_file(self.path, "rb", self.fs) as f:
-                f.seek(offset)
-                for _ in range(count):
-                    th = read_traceheader(f, keys)
-                    headers.append(th)
-                    f.seek(ns * 4, os.SEEK_CUR)
-        return headers
+        with open_file(self.path, "rb", self.fs) as f:
+            table = read_segment_headers(
+                f, self.segments, self.fileheader.bfh.ns, keys
+            )
+        return list(table)
+
+    def _cache_key(
+        self, kind: str, keys: Optional[Iterable[str]] = None, window=None
+    ) -> tuple:
+        """
+        Key identifying the traces of this record in :data:`shot_cache`.
+
+        Local files also contribute their size and modification time, so
+        entries go stale when another process rewrites the file.
+        """
+        stamp = None
+        if self.fs is None:
+            try:
+                st = os.stat(self.path)
+                stamp = (st.st_size, st.st_mtime_ns)
+            except OSError:
+                pass
+        return (
+            kind,
+            self.path,
+            tuple(tuple(s) for s in self.segments),
+            None if keys is None else tuple(keys),
+            window,
+            stamp,
+        )
 
     @property
-    def data(self) -> SeisBlock:
-        if self._data is None:
-            self._data = self.read_data()
-        return self._data
+    def data(self) -> np.ndarray:
+        """
+        Samples of this shot, kept in the shared memory-bounded shot cache.
+
+        The cached array is read-only; use :meth:`read_data` for a copy.
+        """
+        return shot_cache.get_or_load(self._cache_key("data"), self.read_data)
 
     @property
     def rec_coordinates(self) -> np.ndarray:
@@ -119,76 +182,134 @@ class ShotRecord:
             else:
                 xname, yname, zname = "GroupX", "GroupY", self.rec_depth_key
 
-            hdrs = self.read_headers(
-                keys=[
-                    xname,
-                    yname,
-                    zname,
-                    "RecSourceScalar",
-                    "ElevationScalar",
-                ]
-            )
-            gx = get_header(hdrs, xname)
-            gy = get_header(hdrs, yname)
-            dz = get_header(hdrs, zname)
-            self._rec_coords = np.column_stack((gx, gy, dz)).astype(np.float32)
+            keys = [xname, yname, zname, "RecSourceScalar", "ElevationScalar"]
+            with open_file(self.path, "rb", self.fs) as f:
+                table = read_segment_headers(
+                    f, self.segments, self.fileheader.bfh.ns, keys
+                )
+            coords = get_header(table, [xname, yname, zname])
+            self._rec_coords = coords.astype(np.float32)
         return self._rec_coords
 
 
-def _parse_header(buf: bytes, keys: Iterable[str]) -> BinaryTraceHeader:
+@dataclass
+class _ScanRuns:
     """
-    Return a :class:`BinaryTraceHeader` parsed from ``buf``.
+    Runs of consecutive traces sharing the same gather coordinates.
 
-    Parameters
-    ----------
-    buf : bytes
-        240-byte buffer containing the raw trace header.
-    keys : Iterable[str]
-        Header fields to decode from ``buf``.
+    Every run records the byte offset of its first trace, its trace count,
+    its coordinates and the per-key ``(min, max)`` of the summarised headers.
+    """
 
-    Returns
-    -------
-    BinaryTraceHeader
-        Trace header populated with the requested fields.
+    offsets: np.ndarray
+    counts: np.ndarray
+    coords: np.ndarray
+    mins: Dict[str, np.ndarray]
+    maxs: Dict[str, np.ndarray]
+
+    @classmethod
+    def empty(cls, keys: Iterable[str]) -> "_ScanRuns":
+        return cls(
+            np.zeros(0, dtype=np.int64),
+            np.zeros(0, dtype=np.int64),
+            np.zeros((0, 3), dtype=np.float32),
+            {k: np.zeros(0) for k in keys},
+            {k: np.zeros(0) for k in keys},
+        )
+
+    @classmethod
+    def concatenate(cls, parts: List["_ScanRuns"], keys: Iterable[str]) -> "_ScanRuns":
+        """
+        Join consecutive ``parts``, merging runs that continue across them.
+        """
+        keys = list(keys)
+        parts = [p for p in parts if len(p.counts)]
+        if not parts:
+            return cls.empty(keys)
+        # A part whose first run continues the previous part's last run
+        # starts a run that must be folded into that one
+        cont = [False] + [
+            bool((a.coords[-1] == b.coords[0]).all())
+            for a, b in zip(parts[:-1], parts[1:])
+        ]
+        first = np.cumsum([0] + [len(p.counts) for p in parts])[:-1]
+        keep = np.ones(sum(len(p.counts) for p in parts), dtype=bool)
+        keep[first[np.array(cont)]] = False
+        # Runs that are kept start a stitched run, the others extend it
+        starts = np.flatnonzero(keep)
+        counts = np.add.reduceat(np.concatenate([p.counts for p in parts]), starts)
+        return cls(
+            np.concatenate([p.offsets for p in parts])[starts],
+            counts,
+            np.concatenate([p.coords for p in parts])[starts],
+            {
+                k: np.minimum.reduceat(
+                    np.concatenate([p.mins[k] for p in parts]), starts
+                )
+                for k in keys
+            },
+            {
+                k: np.maximum.reduceat(
+                    np.concatenate([p.maxs[k] for p in parts]), starts
+                )
+                for k in keys
+            },
+        )
+
+
+def _chunk_runs(
+    offsets: np.ndarray,
+    hdrs: TraceHeaderTable,
+    coord_keys: Tuple[str, str, str],
+    keys: Iterable[str],
+) -> _ScanRuns:
+    """
+    Split one block of traces into runs of identical gather coordinates.
     """
-    th = BinaryTraceHeader()
+    coords = get_header(hdrs, coord_keys).astype(np.float32)
+    change = (coords[1:] != coords[:-1]).any(axis=1)
+    starts = np.flatnonzero(np.concatenate(([True], change)))
+    counts = np.diff(np.append(starts, len(coords)))
+    mins = {}
+    maxs = {}
     for k in keys:
-        offset, size = TH_BYTE2SAMPLE[k]
-        fmt = ">i" if size == 4 else ">h"
-        val = struct.unpack_from(fmt, buf, offset)[0]
-        setattr(th, k, val)
-    th.keys_loaded = list(keys)
-    return th
+        vals = get_header(hdrs, k)
+        mins[k] = np.minimum.reduceat(vals, starts)
+        maxs[k] = np.maximum.reduceat(vals, starts)
+    return _ScanRuns(offsets[starts], counts, coords[starts], mins, maxs)
 
 
-def _update_summary(
-    summary: Dict[str, Tuple[float, float]],
-    th: BinaryTraceHeader,
+def _group_runs(
+    runs: _ScanRuns,
     keys: Iterable[str],
-) -> None:
+    make_record,
+) -> List[ShotRecord]:
     """
-    Update ``summary`` with values from ``th``.
+    Gather runs sharing coordinates into records sorted by coordinates.
 
-    Parameters
-    ----------
-    summary : dict
-        Mapping of header name to ``(min, max)`` tuple.
-    th : BinaryTraceHeader
-        Header providing new values.
-    keys : Iterable[str]
-        Header fields to include in the summary.
+    ``make_record(coords, segments, summary)`` builds each record.
     """
-    for k in keys:
-        v = get_header([th], k)[0]
-        if k in summary:
-            mn, mx = summary[k]
-            if v < mn:  # pragma: no cover
-                mn = v
-            if v > mx:
-                mx = v
-            summary[k] = (mn, mx)
-        else:
-            summary[k] = (v, v)
+    uniq, inverse = np.unique(runs.coords, axis=0, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    order = np.argsort(inverse, kind="stable")
+    bounds = np.searchsorted(inverse[order], np.arange(len(uniq) + 1))
+    mins = {
+        k: np.minimum.reduceat(runs.mins[k][order], bounds[:-1]).tolist()
+        if len(order) else [] for k in keys
+    }
+    maxs = {
+        k: np.maximum.reduceat(runs.maxs[k][order], bounds[:-1]).tolist()
+        if len(order) else [] for k in keys
+    }
+    offsets = runs.offsets[order].tolist()
+    counts = runs.counts[order].tolist()
+    records = []
+    for g, coord in enumerate(uniq):
+        lo, hi = bounds[g], bounds[g + 1]
+        segments = list(zip(offsets[lo:hi], counts[lo:hi]))
+        summary = {k: (mins[k][g], maxs[k][g]) for k in keys}
+        records.append(make_record(tuple(coord), segments, summary))
+    return records
 
 
 def _iter_trace_headers(
@@ -198,14 +319,18 @@ def _iter_trace_headers(
     ns: int,
     keys: Iterable[str],
     chunk: int = 1024,
-) -> Iterable[Tuple[int, BinaryTraceHeader]]:
+    header_io: str = "auto",
+) -> Iterable[Tuple[np.ndarray, TraceHeaderTable]]:
     """
     Yield offsets and headers from ``f`` starting at ``start``.
 
+    Only the 240-byte headers are fetched; how the sample bytes in between
+    are skipped is chosen by ``header_io`` (see :func:`utils.read_strided`).
+
     Parameters
     ----------
     f : file-like object
-        Opened file positioned at ``start``.
+        Opened file containing the traces.
     start : int
         Byte offset of the first trace.
     count : int
@@ -216,22 +341,24 @@ def _iter_trace_headers(
         Header fields to decode.
     chunk : int, optional
         Number of traces to read per block.
+    header_io : str, optional
+        Header read strategy: ``"auto"``, ``"full"``, ``"strided"``,
+        ``"mmap"`` or ``"ranges"``.
 
     Yields
     ------
     tuple
-        ``(offset, header)`` for each trace encountered.
+        ``(offsets, headers)`` for each block of traces, with ``offsets`` the
+        byte offset of every trace in the block.
     """
     trace_size = 240 + ns * 4
     pos = start
     remaining = count
     while remaining > 0:
         n = min(chunk, remaining)
-        buf = f.read(trace_size * n)
-        for i in range(n):
-            base = i * trace_size
-            hdr = _parse_header(buf[base:base + 240], keys)
-            yield pos + base, hdr
+        buf = read_strided(f, pos, n, trace_size, 240, header_io)
+        hdrs = TraceHeaderTable(unpack_headers(buf, n, keys, True), n)
+        yield pos + trace_size * np.arange(n, dtype=np.int64), hdrs
         pos += n * trace_size
         remaining -= n
 
@@ -248,7 +375,13 @@ class SegyScan:
         Collection of shot metadata describing trace segments.
     """
 
-    def __init__(self, fh: FileHeader, records: List[ShotRecord], fs=None) -> None:
+    def __init__(
+        self,
+        fh: FileHeader,
+        records: List[ShotRecord],
+        fs=None,
+        file_info: Optional[Dict[str, Tuple[int, float]]] = None,
+    ) -> None:
         """
         Create a new :class:`SegyScan` instance.
 
@@ -260,11 +393,16 @@ class SegyScan:
             Shot metadata describing trace segments.
         fs : filesystem-like object, optional
             Filesystem providing ``open`` for reading data lazily.
+        file_info : dict, optional
+            ``(size, mtime)`` of every scanned file, used to detect changes
+            when rescanning incrementally.
         """
         self.fileheader = fh
         self.records = records
         self.fs = fs
-        self._data: Optional[List[SeisBlock]] = None
+        self.file_info = dict(file_info or {})
+        self._spatial: Optional[GridIndex] = None
+        self.filters: Dict[str, Tuple[float, float]] = {}
 
     def __len__(self) -> int:
         """
@@ -307,13 +445,70 @@ class SegyScan:
         return self.records[idx]
 
     @property
-    def data(self) -> List[SeisBlock]:
+    def coordinates(self) -> np.ndarray:
+        """
+        ``(nshots, 3)`` array of gather coordinates.
+        """
+        coords = getattr(self.records, "coordinates", None)
+        if coords is None:
+            coords = [r.coordinates for r in self.records]
+        return np.asarray(coords, dtype=np.float64).reshape(-1, 3)
+
+    @property
+    def spatial_index(self) -> GridIndex:
+        """
+        Grid index over the horizontal gather coordinates, built on first use.
+        """
+        if self._spatial is None or len(self._spatial) != len(self.records):
+            self._spatial = GridIndex(self.coordinates[:, :2])
+        return self._spatial
+
+    def query_box(
+        self, xmin: float, xmax: float, ymin: float, ymax: float
+    ) -> np.ndarray:
+        """
+        Indices of the shots located inside a bounding box.
+
+        Parameters
+        ----------
+        xmin, xmax, ymin, ymax : float
+            Inclusive bounds of the box.
+
+        Returns
+        -------
+        np.ndarray
+            Sorted shot indices.
+        """
+        return self.spatial_index.query_box(xmin, xmax, ymin, ymax)
+
+    def query_radius(self, x: float, y: float, radius: float) -> np.ndarray:
+        """
+        Indices of the shots within ``radius`` of ``(x, y)``.
+
+        Returns
+        -------
+        np.ndarray
+            Sorted shot indices.
+        """
+        return self.spatial_index.query_radius(x, y, radius)
+
+    def nearest(self, x: float, y: float, k: int = 1) -> np.ndarray:
+        """
+        Indices of the ``k`` shots closest to ``(x, y)``.
+
+        Returns
+        -------
+        np.ndarray
+            Shot indices ordered by increasing distance.
+        """
+        return self.spatial_index.nearest(x, y, k)
+
+    @property
+    def data(self) -> Sequence[SeisBlock]:
         """
-        Load data for all shots on first access.
+        Lazy sequence of all shots, read on access through the shot cache.
         """
-        if self._data is None:
-            self._data = [self.read_data(i) for i in range(len(self.records))]
-        return self._data
+        return _ShotBlocks(self)
 
     def summary(self, idx: int) -> dict:
         """
@@ -321,8 +516,74 @@ class SegyScan:
         """
         return self.records[idx].summary
 
+    def _summary_column(self, key: str) -> np.ndarray:
+        """
+        ``(nshots, 2)`` array of the minimum and maximum of ``key`` per shot.
+        """
+        arrays = getattr(self.records, "arrays", None)
+        if arrays is not None:
+            col = arrays.get(f"summary_{key}")
+            if col is None:
+                raise KeyError(key)
+            return np.asarray(col, dtype=np.float64)
+        if not any(key in r.summary for r in self.records):
+            raise KeyError(key)
+        vals = [r.summary.get(key, (np.nan, np.nan)) for r in self.records]
+        return np.array(vals, dtype=np.float64).reshape(-1, 2)
+
+    def select(self, exact: bool = False, **ranges) -> "SegyScan":
+        """
+        Select the shots whose header ranges can match the given bounds.
+
+        The per-shot summaries recorded at scan time act as a zone map:
+        shots whose ``(min, max)`` interval does not overlap the requested
+        range are skipped without reading the file.
+
+        Parameters
+        ----------
+        exact : bool, optional
+            Also drop the individual traces outside the ranges when the
+            selected shots are loaded with :meth:`read_data`.
+        **ranges
+            ``key=(low, high)`` inclusive bounds for summarised header keys.
+            Either bound may be ``None`` and a scalar selects one value.
+
+        Returns
+        -------
+        SegyScan
+            Scan restricted to the matching shots.
+
+        Examples
+        --------
+        >>> near = scan.select(Offset=(0, 3000), exact=True)
+        """
+        keep = np.ones(len(self.records), dtype=bool)
+        bounds: Dict[str, Tuple[float, float]] = {}
+        for key, rng in ranges.items():
+            lo, hi = rng if isinstance(rng, (tuple, list)) else (rng, rng)
+            lo = -np.inf if lo is None else lo
+            hi = np.inf if hi is None else hi
+            try:
+                summ = self._summary_column(key)
+            except KeyError:
+                raise KeyError(
+                    f"{key} was not summarised; scan with keys=[{key!r}]"
+                ) from None
+            # Shots without a summary for this key cannot be pruned
+            keep &= ~(summ[:, 1] < lo) & ~(summ[:, 0] > hi)
+            bounds[key] = (lo, hi)
+        idx = np.flatnonzero(keep)
+        records = [self.records[i] for i in idx]
+        out = SegyScan(self.fileheader, records, fs=self.fs, file_info=self.file_info)
+        out.filters = {**self.filters, **bounds} if exact else dict(self.filters)
+        return out
+
     def read_data(
-        self, idx: int, keys: Optional[Iterable[str]] = None
+        self,
+        idx: int,
+        keys: Optional[Iterable[str]] = None,
+        cache: bool = True,
+        samples: Union[slice, Tuple[Optional[int], ...], None] = None,
     ) -> SeisBlock:
         """
         Load all traces for a single shot.
@@ -333,33 +594,313 @@ class SegyScan:
             Index of the shot to read.
         keys : Iterable[str], optional
             Additional header fields to load with each trace.
+        cache : bool, optional
+            Look the shot up in and add it to the shared
+            :data:`~pysegy.cache.shot_cache`. The returned block always
+            holds private, writable copies of the cached arrays.
+        samples : slice or tuple, optional
+            ``(start, stop, step)`` window of samples to read. Only the bytes
+            up to the last selected sample of each trace are read and the
+            file header and loaded ``ns``, ``dt`` and ``DelayRecordingTime``
+            trace header fields of the block describe the window.
 
         Returns
         -------
         SeisBlock
-            In-memory representation of the selected shot.
+            In-memory representation of the selected shot. Traces outside
+            the ranges of an exact :meth:`select` are dropped.
         """
         rec = self.records[idx]
-        headers: List[BinaryTraceHeader] = []
-        data_parts = []
-        for offset, count in rec.segments:
-            fs_to_use = rec.fs if rec.fs is not None else getattr(self, "fs", None)
+        keys = self._with_filter_keys(keys)
+        fs_to_use = rec.fs if rec.fs is not None else getattr(self, "fs", None)
+
+        ns = self.fileheader.bfh.ns
+        window = None
+        if samples is not None:
+            _, sl, nout = sample_window(samples, ns)
+            window = (sl.start, sl.stop, sl.step)
+
+        def load():
             with open_file(rec.path, "rb", fs_to_use) as f:
-                f.seek(offset)
-                h, d = read_traces(
+                table, data = read_segments(
                     f,
-                    self.fileheader.bfh.ns,
-                    count,
+                    rec.segments,
+                    ns,
                     self.fileheader.bfh.DataSampleFormat,
                     keys,
+                    samples=samples,
                 )
-            headers.extend(h)
-            data_parts.append(d)
-        if data_parts:
-            data = np.concatenate(data_parts, axis=1)
+            if window is not None:
+                window_traceheaders(table, sl, nout, self.fileheader.bfh.dt)
+            return table.columns, data
+
+        if cache:
+            columns, data = shot_cache.get_or_load(
+                rec._cache_key("block", keys, window), load
+            )
         else:
-            data = []  # pragma: no cover
-        return SeisBlock(self.fileheader, headers, data)
+            columns, data = load()
+        block = self._make_block(columns, data, copy=cache)
+        if window is not None:
+            block.fileheader = window_fileheader(self.fileheader, nout, window[2])
+        return block
+
+    async def aread_data(
+        self, idx: int, keys: Optional[Iterable[str]] = None, cache: bool = True
+    ) -> SeisBlock:
+        """
+        Asynchronous counterpart of :meth:`read_data`.
+
+        The coalesced byte ranges of the shot are split into requests of at
+        most :data:`~pysegy.aio.REQUEST_BYTES`, each fetched on its own with
+        :func:`~pysegy.aio.cat_range` and decoded as soon as it arrives, with
+        up to :data:`~pysegy.aio.MAX_CONCURRENCY` in flight. fsspec
+        filesystems created with ``asynchronous=True`` are awaited natively
+        through ``_cat_file``; other files are read from worker threads.
+        """
+        rec = self.records[idx]
+        keys = self._with_filter_keys(keys)
+        fs_to_use = rec.fs if rec.fs is not None else getattr(self, "fs", None)
+        key = rec._cache_key("block", keys)
+        cached = shot_cache.get(key) if cache else None
+        if cached is None:
+            table, data = await aread_segments(
+                rec.path,
+                rec.segments,
+                self.fileheader.bfh.ns,
+                self.fileheader.bfh.DataSampleFormat,
+                keys,
+                fs_to_use,
+            )
+            cached = (table.columns, data)
+            if cache:
+                shot_cache.put(key, cached)
+        return self._make_block(*cached, copy=cache)
+
+    def _make_block(
+        self, columns: Dict[str, np.ndarray], data: np.ndarray, copy: bool = False
+    ) -> SeisBlock:
+        """
+        Wrap decoded arrays into a fresh :class:`SeisBlock`.
+
+        ``copy`` detaches the block from read-only cached arrays.
+        """
+        if copy:
+            columns = {k: v.copy() for k, v in columns.items()}
+            data = data.copy()
+        table = TraceHeaderTable(dict(columns), data.shape[1])
+        table, data = self._filter_traces(table, data)
+        return SeisBlock(self.fileheader, table, data)
+
+    def _with_filter_keys(
+        self, keys: Optional[Iterable[str]]
+    ) -> Optional[List[str]]:
+        """
+        Extend ``keys`` with the filtered fields and the scalars they need.
+        """
+        if not self.filters or keys is None:
+            return keys
+        extra = []
+        for k in self.filters:
+            scalable, scale_name = _check_scale(k)
+            extra.extend([k, scale_name] if scalable else [k])
+        return list(dict.fromkeys([*keys, *extra]))
+
+    def _filter_traces(
+        self, table: TraceHeaderTable, data: np.ndarray
+    ) -> Tuple[TraceHeaderTable, np.ndarray]:
+        """
+        Drop the traces outside the ranges of an exact :meth:`select`.
+        """
+        if not self.filters:
+            return table, data
+        mask = np.ones(table.ntraces, dtype=bool)
+        for key, (lo, hi) in self.filters.items():
+            vals = get_header(table, key)
+            mask &= (vals >= lo) & (vals <= hi)
+        return table[mask], data[:, mask]
+
+    def read_many(
+        self,
+        indices: Iterable[int],
+        keys: Optional[Iterable[str]] = None,
+        max_workers: Optional[int] = None,
+        out: Optional[np.ndarray] = None,
+        pad: bool = False,
+    ) -> Union[List[SeisBlock], np.ndarray]:
+        """
+        Read a batch of shots concurrently.
+
+        The byte ranges of all requested shots are planned up front with
+        :func:`~pysegy.read.plan_segments` and fetched by a thread pool, each
+        read decoding straight into the preallocated output.
+
+        Parameters
+        ----------
+        indices : Iterable[int]
+            Shots to read.
+        keys : Iterable[str], optional
+            Header fields to load with each trace.
+        max_workers : int, optional
+            Number of reader threads, by default that of
+            :class:`~concurrent.futures.ThreadPoolExecutor`.
+        out : np.ndarray, optional
+            ``(nshots, ns, ntraces)`` ``float32`` array receiving the padded
+            batch. Implies ``pad=True``.
+        pad : bool, optional
+            Return the samples as one zero-padded 3D array instead of a list
+            of :class:`SeisBlock`.
+
+        Returns
+        -------
+        list of SeisBlock or np.ndarray
+            Blocks in the order of ``indices``, or the padded array.
+        """
+        indices = [int(i) for i in indices]
+        records = [self.records[i] for i in indices]
+        ns = self.fileheader.bfh.ns
+        datatype = self.fileheader.bfh.DataSampleFormat
+        trace_size = 240 + ns * 4
+        keys = self._with_filter_keys(keys)
+        keys = list(TH_BYTE2SAMPLE) if keys is None else list(dict.fromkeys(keys))
+        dtype = trace_dtype(ns, datatype, tuple(keys), True)
+        counts = [sum(max(c, 0) for _, c in r.segments) for r in records]
+
+        # Without trace filters shots decode straight into the padded output
+        pad = pad or out is not None
+        direct = pad and not self.filters
+        if direct:
+            out = self._batch_out(out, len(records), ns, max(counts, default=0))
+            data = [out[j, :, :n] for j, n in enumerate(counts)]
+        else:
+            data = [np.empty((ns, n), dtype=np.float32) for n in counts]
+        columns = [empty_columns(dtype, keys, n) for n in counts]
+
+        def fetch(j, start, ntraces, rows, cols):
+            rec = records[j]
+            fs = rec.fs if rec.fs is not None else self.fs
+            with open_file(rec.path, "rb", fs) as f:
+                f.seek(start)
+                raw = f.read(trace_size * ntraces)
+            scatter_traces(raw, dtype, rows, cols, datatype, columns[j], data[j])
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = [
+                pool.submit(fetch, j, *task)
+                for j, rec in enumerate(records)
+                for task in plan_segments(rec.segments, trace_size)
+            ]
+            for fut in futures:
+                fut.result()
+
+        if direct:
+            for j, n in enumerate(counts):
+                out[j, :, n:] = 0
+            return out
+        blocks = []
+        for j, n in enumerate(counts):
+            table, d = self._filter_traces(TraceHeaderTable(columns[j], n), data[j])
+            blocks.append(SeisBlock(self.fileheader, table, d))
+        if not pad:
+            return blocks
+        width = max((b.data.shape[1] for b in blocks), default=0)
+        out = self._batch_out(out, len(blocks), ns, width)
+        for j, b in enumerate(blocks):
+            n = b.data.shape[1]
+            out[j, :, :n] = b.data
+            out[j, :, n:] = 0
+        return out
+
+    def iter_shots(
+        self,
+        prefetch: int = 2,
+        order: Union[str, Iterable[int]] = "index",
+        keys: Optional[Iterable[str]] = None,
+    ) -> Iterator[Tuple[int, SeisBlock]]:
+        """
+        Iterate over shots while the next ones are read in the background.
+
+        Parameters
+        ----------
+        prefetch : int, optional
+            Number of shots read ahead while the current one is processed.
+            At most ``prefetch + 1`` shots are held in memory, ``0`` reads
+            each shot only when it is requested. Streamed shots bypass the
+            shot cache.
+        order : str or Iterable[int], optional
+            ``"index"`` follows the scan order, ``"file"`` sorts shots by
+            file and byte offset to minimise seeks and ``"spatial"`` follows
+            a Z-order curve over the shot coordinates. An explicit sequence
+            of shot indices is also accepted.
+        keys : Iterable[str], optional
+            Header fields to load with each trace.
+
+        Yields
+        ------
+        tuple
+            ``(index, block)`` for every shot.
+        """
+        if isinstance(order, str):
+            if order == "index":
+                indices = list(range(len(self.records)))
+            elif order == "file":
+                indices = sorted(
+                    range(len(self.records)),
+                    key=lambda i: (
+                        self.records[i].path, self.records[i].segments[0][0]
+                    ),
+                )
+            elif order == "spatial":
+                indices = morton_order(self.coordinates[:, :2]).tolist()
+            else:
+                raise ValueError(f"Unknown shot order {order!r}")
+        else:
+            indices = [int(i) for i in order]
+
+        if prefetch <= 0:
+            for i in indices:
+                yield i, self.read_data(i, keys, cache=False)
+            return
+
+        remaining = iter(indices)
+        pending: Deque[Tuple[int, Future]] = deque()
+        with ThreadPoolExecutor(max_workers=prefetch) as pool:
+
+            def fill() -> None:
+                while len(pending) < prefetch:
+                    i = next(remaining, None)
+                    if i is None:
+                        break
+                    pending.append(
+                        (i, pool.submit(self.read_data, i, keys, cache=False))
+                    )
+
+            try:
+                fill()
+                while pending:
+                    i, fut = pending.popleft()
+                    block = fut.result()
+                    fill()
+                    yield i, block
+            finally:
+                for _, fut in pending:
+                    fut.cancel()
+
+    @staticmethod
+    def _batch_out(
+        out: Optional[np.ndarray], nshots: int, ns: int, ntraces: int
+    ) -> np.ndarray:
+        """
+        Check or allocate the padded output of :meth:`read_many`.
+        """
+        if out is None:
+            return np.zeros((nshots, ns, ntraces), dtype=np.float32)
+        if out.ndim != 3 or out.shape[:2] != (nshots, ns) or out.shape[2] < ntraces:
+            raise ValueError(
+                f"out must have shape ({nshots}, {ns}, >={ntraces}), "
+                f"got {out.shape}"
+            )
+        return out
 
     def read_headers(
         self, idx: int, keys: Optional[Iterable[str]] = None
@@ -380,17 +921,12 @@ class SegyScan:
             Parsed headers for the requested shot.
         """
         rec = self.records[idx]
-        headers: List[BinaryTraceHeader] = []
-        ns = self.fileheader.bfh.ns
-        for offset, count in rec.segments:
-            fs_to_use = rec.fs if rec.fs is not None else getattr(self, "fs", None)
-            with open_file(rec.path, "rb", fs_to_use) as f:
-                f.seek(offset)
-                for _ in range(count):
-                    th = read_traceheader(f, keys)
-                    headers.append(th)
-                    f.seek(ns * 4, os.SEEK_CUR)
-        return headers
+        fs_to_use = rec.fs if rec.fs is not None else getattr(self, "fs", None)
+        with open_file(rec.path, "rb", fs_to_use) as f:
+            table = read_segment_headers(
+                f, rec.segments, self.fileheader.bfh.ns, keys
+            )
+        return list(table)
 
     def __str__(self) -> str:
         lines = ["SegyScan:"]
@@ -402,7 +938,24 @@ class SegyScan:
     __repr__ = __str__
 
 
-def _scan_file(
+class _ShotBlocks(Sequence):
+    """
+    Read-only sequence view of every shot of a :class:`SegyScan`.
+    """
+
+    def __init__(self, scan: SegyScan) -> None:
+        self.scan = scan
+
+    def __len__(self) -> int:
+        return len(self.scan.records)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+        return self.scan.read_data(idx)
+
+
+def _scan_runs(
     path: str,
     keys: Optional[Iterable[str]] = None,
     chunk: int = 1024,
@@ -410,35 +963,30 @@ def _scan_file(
     rec_depth_key: str = "GroupWaterDepth",
     fs=None,
     by_receiver: bool = False,
-) -> SegyScan:
+    header_io: str = "auto",
+    first: int = 0,
+    ntraces: Optional[int] = None,
+) -> Tuple[FileHeader, _ScanRuns]:
     """
-    Scan ``path`` for shot locations.
-
-    Parameters
-    ----------
-    path : str
-        SEGY file to scan.
-    keys : Iterable[str], optional
-        Additional header fields to summarise.
-    chunk : int, optional
-        Number of traces to read at once.
-    depth_key : str, optional
-        Trace header field giving the source depth.
-    rec_depth_key : str, optional
-        Header field giving the receiver depth.
-    by_receiver : bool, optional
-        Group traces by receiver coordinates instead of source coordinates.
+    Read the headers of ``path`` and reduce them to runs of traces.
 
-    fs : filesystem-like object, optional
-        Filesystem providing ``open`` if reading from non-local storage.
+    This is the unit of work of :func:`segy_scan`. Its result is small and
+    picklable so it can be computed in a worker process. ``first`` and
+    ``ntraces`` restrict the scan to a range of traces so that large files
+    can be split across workers.
 
     Returns
     -------
-    SegyScan
-        Object describing all shots found in ``path``.
+    tuple
+        ``(fileheader, runs)`` for the scanned traces.
     """
-    thread = threading.current_thread().name
-    print(f"{thread} scanning file {path}")
+    worker = f"{os.getpid()}/{threading.current_thread().name}"
+    if ntraces is None:
+        print(f"{worker} scanning file {path}")
+    else:
+        print(
+            f"{worker} scanning traces {first}-{first + ntraces} of {path}"
+        )
     trace_keys = [
         "SourceX",
         "SourceY",
@@ -458,77 +1006,180 @@ def _scan_file(
         fh = read_fileheader(f)
         print(f"Header for {path}: ns={fh.bfh.ns} dt={fh.bfh.dt}")
         ns = fh.bfh.ns
+        trace_size = 240 + ns * 4
         f.seek(0, os.SEEK_END)
-        total = (f.tell() - 3600) // (240 + ns * 4)
-        f.seek(3600)
-
-        records: Dict[Tuple[int, int, int], ShotRecord] = {}
-
-        previous: Optional[Tuple[int, int, int]] = None
-        seg_start = 0
-        seg_count = 0
-
-        for offset, th in _iter_trace_headers(
-            f,
-            3600,
-            total,
-            ns,
-            trace_keys,
-            chunk,
-        ):
-            if by_receiver:
-                src = (
-                    np.float32(get_header([th], "GroupX")[0]),
-                    np.float32(get_header([th], "GroupY")[0]),
-                    np.float32(get_header([th], rec_depth_key)[0]),
-                )
-            else:
-                src = (
-                    np.float32(get_header([th], "SourceX")[0]),
-                    np.float32(get_header([th], "SourceY")[0]),
-                    np.float32(get_header([th], depth_key)[0]),
-                )
-
-            rec = records.get(src)
-            if rec is None:
-                rec = ShotRecord(
-                    path,
-                    src,
-                    fh,
-                    depth_key if by_receiver else rec_depth_key,
-                    rec_depth_key if by_receiver else depth_key,
-                    by_receiver,
-                    [],
-                    {},
+        total = (f.tell() - 3600) // trace_size
+        if ntraces is not None:
+            total = max(0, min(ntraces, total - first))
+        if by_receiver:
+            coord_keys = ("GroupX", "GroupY", rec_depth_key)
+        else:
+            coord_keys = ("SourceX", "SourceY", depth_key)
+        summary_keys = list(keys or [])
+        runs = _ScanRuns.concatenate(
+            [
+                _chunk_runs(offsets, hdrs, coord_keys, summary_keys)
+                for offsets, hdrs in _iter_trace_headers(
+                    f,
+                    3600 + first * trace_size,
+                    total,
                     ns,
-                    fh.bfh.dt,
-                    fs,
+                    trace_keys,
+                    chunk,
+                    header_io,
                 )
-                records[src] = rec
-            _update_summary(rec.summary, th, keys or [])
-
-            # New segment begins when the source position changes
-            if previous is None:
-                previous = src
-                seg_start = offset
-                seg_count = 1
-            elif src == previous:
-                seg_count += 1
-            else:
-                records[previous].segments.append((seg_start, seg_count))
-                previous = src
-                seg_start = offset
-                seg_count = 1
+            ],
+            summary_keys,
+        )
+    return fh, runs
 
-        if previous is not None:
-            # Append the final segment for the last shot
-            records[previous].segments.append((seg_start, seg_count))
 
-    record_list = sorted(records.values(), key=lambda r: r.coordinates)
-    print(f"{thread} found {len(record_list)} shots in {path}")
+def _split_file(
+    path: str, size: int, fs=None, split_bytes: Optional[int] = None
+) -> List[Tuple[int, Optional[int]]]:
+    """
+    Return ``(first, ntraces)`` trace ranges covering ``path`` of ``size`` bytes.
+
+    Files larger than ``split_bytes`` are cut into trace-aligned ranges of
+    about that size, smaller ones are scanned as a whole without any I/O.
+    """
+    if split_bytes is None or size <= split_bytes:
+        return [(0, None)]
+    with open_file(path, "rb", fs) as f:
+        ns = read_fileheader(f).bfh.ns
+    trace_size = 240 + ns * 4
+    total = (size - 3600) // trace_size
+    if total <= 0:
+        return [(0, None)]
+    step = max(1, split_bytes // trace_size)
+    return [(i, min(step, total - i)) for i in range(0, total, step)]
+
+
+def _build_records(
+    path: str,
+    fh: FileHeader,
+    runs: _ScanRuns,
+    keys: Optional[Iterable[str]] = None,
+    depth_key: str = "SourceDepth",
+    rec_depth_key: str = "GroupWaterDepth",
+    fs=None,
+    by_receiver: bool = False,
+) -> List[ShotRecord]:
+    """
+    Turn the runs found in ``path`` into :class:`ShotRecord` objects.
+    """
+    def make_record(src, segments, summary):
+        return ShotRecord(
+            path,
+            src,
+            fh,
+            depth_key if by_receiver else rec_depth_key,
+            rec_depth_key if by_receiver else depth_key,
+            by_receiver,
+            segments,
+            summary,
+            fh.bfh.ns,
+            fh.bfh.dt,
+            fs,
+        )
+
+    return _group_runs(runs, list(keys or []), make_record)
+
+
+def _scan_file(
+    path: str,
+    keys: Optional[Iterable[str]] = None,
+    chunk: int = 1024,
+    depth_key: str = "SourceDepth",
+    rec_depth_key: str = "GroupWaterDepth",
+    fs=None,
+    by_receiver: bool = False,
+    header_io: str = "auto",
+) -> SegyScan:
+    """
+    Scan ``path`` for shot locations.
+
+    Parameters
+    ----------
+    path : str
+        SEGY file to scan.
+    keys : Iterable[str], optional
+        Additional header fields to summarise.
+    chunk : int, optional
+        Number of traces to read at once.
+    depth_key : str, optional
+        Trace header field giving the source depth.
+    rec_depth_key : str, optional
+        Header field giving the receiver depth.
+    by_receiver : bool, optional
+        Group traces by receiver coordinates instead of source coordinates.
+
+    fs : filesystem-like object, optional
+        Filesystem providing ``open`` if reading from non-local storage.
+    header_io : str, optional
+        Strategy used to read the trace headers without the samples, see
+        :func:`segy_scan`.
+
+    Returns
+    -------
+    SegyScan
+        Object describing all shots found in ``path``.
+    """
+    fh, runs = _scan_runs(
+        path, keys, chunk, depth_key, rec_depth_key, fs, by_receiver, header_io
+    )
+    record_list = _build_records(
+        path, fh, runs, keys, depth_key, rec_depth_key, fs, by_receiver
+    )
+    print(f"Found {len(record_list)} shots in {path}")
     return SegyScan(fh, record_list, fs=fs)
 
 
+def _file_stamp(info: dict) -> Tuple[int, Any]:
+    """
+    Return ``(size, mtime)`` from an fsspec ``info`` dictionary.
+    """
+    mtime = None
+    for k in ("mtime", "LastModified", "last_modified", "updated", "created"):
+        if info.get(k) is not None:
+            mtime = info[k]
+            break
+    if hasattr(mtime, "timestamp"):
+        mtime = mtime.timestamp()
+    return int(info.get("size") or 0), mtime
+
+
+def _list_files(
+    path: str, file_key: Optional[str] = None, fs=None
+) -> Tuple[str, Dict[str, Tuple[int, Any]]]:
+    """
+    Return the directory and the ``(size, mtime)`` of every file to scan.
+    """
+    if file_key is None and (
+        (fs is None and os.path.isfile(path)) or (fs and fs.isfile(path))
+    ):
+        if fs is None:
+            directory = os.path.dirname(path) or "."
+            st = os.stat(path)
+            return directory, {path: (st.st_size, st.st_mtime)}
+        directory = getattr(fs, "_parent", os.path.dirname)(path)
+        return directory, {path: _file_stamp(fs.info(path))}
+
+    directory = path
+    pattern = file_key or "*"
+    if fs is None:
+        with os.scandir(directory) as entries:
+            return directory, {
+                os.path.join(directory, e.name): (
+                    e.stat().st_size, e.stat().st_mtime
+                )
+                for e in entries
+                if fnmatch.fnmatch(e.name, pattern)
+            }
+    found = fs.glob(f"{directory.rstrip('/')}/{pattern}", detail=True)
+    return directory, {f: _file_stamp(info) for f, info in found.items()}
+
+
 def segy_scan(
     path: str,
     file_key: Optional[str] = None,
@@ -539,6 +1190,10 @@ def segy_scan(
     threads: Optional[int] = None,
     fs=None,
     by_receiver: bool = False,
+    header_io: str = "auto",
+    executor: Union[str, Executor] = "thread",
+    split_bytes: Optional[int] = 256 * 2**20,
+    previous: Optional[SegyScan] = None,
 ) -> SegyScan:
     """
     Scan one or more SEGY files and merge the results.
@@ -563,6 +1218,31 @@ def segy_scan(
         by source coordinates.
     fs : filesystem-like object, optional
         Filesystem providing ``open`` and ``glob`` if scanning non-local paths.
+    header_io : str, optional
+        How trace headers are read while skipping the samples: ``"full"``
+        reads whole traces, ``"strided"`` issues one positional read per
+        header, ``"mmap"`` copies headers out of a memory mapping and
+        ``"ranges"`` fetches them as concurrent byte-range requests through
+        fsspec. ``"auto"`` reads whole traces when the samples are shorter
+        than a page and otherwise picks ``"mmap"`` for local files and
+        ``"ranges"`` for remote ones.
+    threads : int, optional
+        Number of workers; defaults to the number of CPUs.
+    executor : str or concurrent.futures.Executor, optional
+        ``"thread"`` scans files in a thread pool, ``"process"`` in a process
+        pool, which scales with cores for directories of many files. Any
+        executor instance may be passed instead and is left running. Workers
+        only return the compact runs of each file, records are assembled in
+        the calling process.
+    split_bytes : int, optional
+        Files larger than this many bytes are split into trace-aligned
+        ranges scanned in parallel and stitched back together, so a single
+        huge file uses all workers. ``None`` scans every file as one task.
+    previous : SegyScan, optional
+        Earlier scan of the same files made with the same options. Files
+        whose size and modification time are unchanged keep their records,
+        only new or modified files are read and records of files that no
+        longer exist are dropped.
 
     Returns
     -------
@@ -573,106 +1253,86 @@ def segy_scan(
     if threads is None:
         threads = os.cpu_count() or 1
 
-    if file_key is None and (
-        (fs is None and os.path.isfile(path)) or (fs and fs.isfile(path))
-    ):
-        files = [path]
-        if fs is None:
-            directory = os.path.dirname(path) or "."
-        else:
-            directory = getattr(fs, "_parent", os.path.dirname)(path)
-    else:
-        directory = path
-        pattern = file_key or "*"
-        if fs is None:
-            files = [
-                os.path.join(directory, fname)
-                for fname in os.listdir(directory)
-                if fnmatch.fnmatch(fname, pattern)
-            ]
-        else:
-            files = fs.glob(f"{directory.rstrip('/')}/{pattern}")
-    files.sort()
+    directory, file_info = _list_files(path, file_key, fs)
+    files = sorted(file_info)
+
+    # Reuse the records of files whose size and mtime did not change
+    reused: Dict[str, List[ShotRecord]] = {}
+    if previous is not None:
+        unchanged = {
+            f for f in files if previous.file_info.get(f) == file_info[f]
+        }
+        for rec in previous.records:
+            if rec.path in unchanged:
+                reused.setdefault(rec.path, []).append(rec)
+        for f in unchanged:
+            reused.setdefault(f, [])
+    to_scan = [f for f in files if f not in reused]
 
     print(
-        f"Scanning {len(files)} files in {directory} with {threads} threads"
+        f"Scanning {len(to_scan)} files in {directory} with {threads} workers"
     )
-    records: List[ShotRecord] = []
-    with ThreadPoolExecutor(max_workers=threads) as pool:
-        futures = {
-            pool.submit(
-                _scan_file,
-                f,
-                keys,
-                chunk,
-                depth_key,
-                rec_depth_key,
-                fs,
-                by_receiver,
-            ): f
-            for f in files
+    if previous is not None:
+        print(f"Reusing {len(reused)} unchanged files from previous scan")
+    if isinstance(executor, Executor):
+        pool_ctx = nullcontext(executor)
+    elif executor == "thread":
+        pool_ctx = ThreadPoolExecutor(max_workers=threads)
+    elif executor == "process":
+        pool_ctx = ProcessPoolExecutor(max_workers=threads)
+    else:
+        raise ValueError(f"Unknown executor {executor!r}")
+
+    fh: Optional[FileHeader] = None
+    scanned: Dict[str, List[ShotRecord]] = {}
+    with pool_ctx as pool:
+        # Only files that get split need their header, read in the workers
+        splits = {
+            f: pool.submit(_split_file, f, file_info[f][0], fs, split_bytes)
+            for f in to_scan
+            if split_bytes is not None and file_info[f][0] > split_bytes
         }
-        for fut in as_completed(futures):
-            scan = fut.result()
-            fh = scan.fileheader
-            records.extend(scan.records)
+        futures = [
+            [
+                pool.submit(
+                    _scan_runs,
+                    f,
+                    keys,
+                    chunk,
+                    depth_key,
+                    rec_depth_key,
+                    fs,
+                    by_receiver,
+                    header_io,
+                    first,
+                    ntraces,
+                )
+                for first, ntraces in (
+                    splits[f].result() if f in splits else [(0, None)]
+                )
+            ]
+            for f in to_scan
+        ]
+        for f, parts in zip(to_scan, futures):
+            results = [fut.result() for fut in parts]
+            file_fh = results[0][0]
+            fh = fh or file_fh
+            runs = _ScanRuns.concatenate([r for _, r in results], keys or [])
+            scanned[f] = _build_records(
+                f, file_fh, runs, keys, depth_key, rec_depth_key, fs, by_receiver
+            )
+
+    # Merge in file order so ties between files sort deterministically
+    records: List[ShotRecord] = []
+    for f in files:
+        records.extend(scanned[f] if f in scanned else reused[f])
 
     if not records:
         raise FileNotFoundError("No matching SEGY files found")
+    if fh is None:
+        fh = previous.fileheader
 
     records.sort(key=lambda r: r.coordinates)
 
     print(f"Combined scan has {len(records)} shots")
-    return SegyScan(fh, records, fs=fs)
-
-
-def save_scan(path: str, scan: SegyScan, fs=None) -> None:
-    """
-    Serialize ``scan`` to ``path``.
-
-    Parameters
-    ----------
-    path : str
-        Destination file path. When ``fs`` is provided the path is interpreted
-        relative to that filesystem.
-    scan : SegyScan
-        Object to serialize.
-    fs : filesystem-like object, optional
-        Filesystem providing ``open`` when writing to non-local storage.
-    """
-    print(f"Saving SegyScan to {path}")
-    with open_file(path, "wb", fs) as f:
-        cloudpickle.dump(scan, f, protocol=cloudpickle.DEFAULT_PROTOCOL)
-    print(f"Finished saving {path}")
-
-
-def load_scan(path: str, fs=None) -> SegyScan:
-    """
-    Load a :class:`SegyScan` previously saved with :func:`save_scan`.
-
-    Parameters
-    ----------
-    path : str
-        File system path of the saved object. When ``fs`` is provided the path
-        is interpreted relative to that filesystem.
-    fs : filesystem-like object, optional
-        Filesystem providing ``open`` when reading from non-local storage.
-
-    Returns
-    -------
-    SegyScan
-        Deserialized scan object.
-    """
-    print(f"Loading SegyScan from {path}")
-    with open_file(path, "rb", fs) as f:
-        scan = cloudpickle.load(f)
-
-    # When loading from external storage the filesystem won't be part of the
-    # serialized object. Attach it so lazy reads work correctly.
-    if fs is not None:
-        scan.fs = fs
-        for rec in scan.records:
-            rec.fs = fs
-
-    print(f"Loaded SegyScan with {len(scan.records)} shots")
-    return scan
+    return SegyScan(fh, records, fs=fs, file_info=file_info)
@@ -0,0 +1,175 @@
+"""
+Grid hash over shot coordinates for box, radius and nearest-neighbour queries.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+
+def morton_order(xy: np.ndarray, bits: int = 16) -> np.ndarray:
+    """
+    Order 2D points along a Z-order curve so that neighbours stay close.
+
+    Coordinates are quantized to ``bits`` bits per axis over their bounding
+    box and the bits of both axes interleaved into one sort key.
+    """
+    xy = np.asarray(xy, dtype=np.float64).reshape(-1, 2)
+    if not len(xy):
+        return np.zeros(0, dtype=np.int64)
+    lo = xy.min(axis=0)
+    extent = xy.max(axis=0) - lo
+    extent[extent == 0] = 1.0
+    q = ((xy - lo) / extent * (2**bits - 1)).astype(np.uint64)
+    code = np.zeros(len(xy), dtype=np.uint64)
+    for b in range(bits):
+        bit = np.uint64(1 << b)
+        code |= (q[:, 0] & bit) << np.uint64(b)
+        code |= (q[:, 1] & bit) << np.uint64(b + 1)
+    return np.argsort(code, kind="stable")
+
+
+class GridIndex:
+    """
+    Uniform grid hash over 2D points.
+
+    Points are bucketed into square cells and stored sorted by cell id,
+    column major, so the cells of one grid column covered by a query form a
+    single contiguous slice found with :func:`numpy.searchsorted`. Cells are
+    sized from the density of the occupied region rather than the bounding
+    box, so clustered surveys and a few outliers keep cells small.
+
+    Parameters
+    ----------
+    xy : np.ndarray
+        ``(n, 2)`` point coordinates.
+    per_cell : float, optional
+        Average number of points per occupied cell.
+    """
+
+    def __init__(self, xy: np.ndarray, per_cell: float = 4.0) -> None:
+        xy = np.asarray(xy, dtype=np.float64).reshape(-1, 2)
+        self.xy = xy
+        n = len(xy)
+        if n:
+            self.lo, self.hi = xy.min(axis=0), xy.max(axis=0)
+        else:
+            self.lo, self.hi = np.zeros(2), np.zeros(2)
+        # Extent of the 1st to 99th percentile box, so a few stray points,
+        # such as traces with zeroed coordinates, do not inflate the cells
+        core = np.ptp(np.percentile(xy, [1, 99], axis=0), axis=0) if n else self.lo
+        self.cell = self._initial_cell(core, per_cell)
+        self._build()
+        # Clustered points leave most of the box empty; shrink the cells
+        # until occupied cells hold about per_cell points.
+        for _ in range(3):
+            occupied = 1 + np.count_nonzero(np.diff(self.keys)) if n else 1
+            ratio = n / occupied / per_cell
+            if ratio <= 2:
+                break
+            cell = self._clamp(self.cell / (np.sqrt(ratio) if core.all() else ratio))
+            if cell >= self.cell:
+                break
+            self.cell = cell
+            self._build()
+
+    def _initial_cell(self, extent: np.ndarray, per_cell: float) -> float:
+        """
+        Cell size giving ``per_cell`` points per cell over ``extent``.
+        """
+        n = len(self.xy)
+        if not n:
+            return 1.0
+        if not extent.any():
+            extent = self.hi - self.lo
+        if extent.all():
+            cell = np.sqrt(extent.prod() * per_cell / n)
+        elif extent.any():
+            cell = extent.max() * per_cell / n
+        else:
+            cell = 1.0
+        return self._clamp(cell)
+
+    def _clamp(self, cell: float) -> float:
+        # Keep at most 2**31 cells per axis so cell ids fit in int64
+        return float(max(cell, (self.hi - self.lo).max() / 2**31))
+
+    def _build(self) -> None:
+        self.shape = np.floor((self.hi - self.lo) / self.cell).astype(np.int64) + 1
+        keys = self._cells(self.xy)
+        self.order = np.argsort(keys)
+        self.keys = keys[self.order]
+
+    def __len__(self) -> int:
+        return len(self.xy)
+
+    def _cells(self, xy: np.ndarray) -> np.ndarray:
+        ij = np.floor((xy - self.lo) / self.cell).astype(np.int64)
+        return ij[:, 0] * self.shape[1] + ij[:, 1]
+
+    def _cell_range(self, lo: float, hi: float, axis: int) -> Tuple[int, int]:
+        first = int(np.floor((lo - self.lo[axis]) / self.cell))
+        last = int(np.floor((hi - self.lo[axis]) / self.cell))
+        return max(first, 0), min(last, int(self.shape[axis]) - 1)
+
+    def _candidates(
+        self, xmin: float, xmax: float, ymin: float, ymax: float
+    ) -> np.ndarray:
+        """
+        Indices of points in the cells overlapping the box.
+        """
+        i0, i1 = self._cell_range(xmin, xmax, 0)
+        j0, j1 = self._cell_range(ymin, ymax, 1)
+        if i0 > i1 or j0 > j1:
+            return np.zeros(0, dtype=np.int64)
+        cols = np.arange(i0, i1 + 1, dtype=np.int64) * self.shape[1]
+        starts = np.searchsorted(self.keys, cols + j0, side="left")
+        stops = np.searchsorted(self.keys, cols + j1, side="right")
+        lengths = stops - starts
+        total = int(lengths.sum())
+        if total == 0:
+            return np.zeros(0, dtype=np.int64)
+        # Concatenate the slices starts[k]:stops[k] without a Python loop
+        pos = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+        return self.order[pos + np.arange(total)]
+
+    def query_box(
+        self, xmin: float, xmax: float, ymin: float, ymax: float
+    ) -> np.ndarray:
+        """
+        Sorted indices of the points inside the closed box.
+        """
+        idx = self._candidates(xmin, xmax, ymin, ymax)
+        x, y = self.xy[idx, 0], self.xy[idx, 1]
+        keep = (x >= xmin) & (x <= xmax) & (y >= ymin) & (y <= ymax)
+        return np.sort(idx[keep])
+
+    def query_radius(self, x: float, y: float, r: float) -> np.ndarray:
+        """
+        Sorted indices of the points within distance ``r`` of ``(x, y)``.
+        """
+        idx = self._candidates(x - r, x + r, y - r, y + r)
+        d2 = (self.xy[idx, 0] - x) ** 2 + (self.xy[idx, 1] - y) ** 2
+        return np.sort(idx[d2 <= r * r])
+
+    def nearest(self, x: float, y: float, k: int = 1) -> np.ndarray:
+        """
+        Indices of the ``k`` points closest to ``(x, y)``, nearest first.
+        """
+        k = min(int(k), len(self))
+        if k <= 0:
+            return np.zeros(0, dtype=np.int64)
+        # Grow the search radius until it holds k points; the k-th nearest
+        # point is then guaranteed to lie inside it.
+        corner = np.maximum(np.abs(self.lo - (x, y)), np.abs(self.hi - (x, y)))
+        far = np.hypot(*corner)
+        r = self.cell * max(1.0, np.sqrt(k))
+        while True:
+            idx = self._candidates(x - r, x + r, y - r, y + r)
+            d2 = (self.xy[idx, 0] - x) ** 2 + (self.xy[idx, 1] - y) ** 2
+            inside = d2 <= r * r
+            if inside.sum() >= k or r > far:
+                idx, d2 = idx[inside], d2[inside]
+                best = np.lexsort((idx, d2))[:k]
+                return idx[best]
+            r *= 2
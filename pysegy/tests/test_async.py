@@ -1,5 +1,10 @@
+import asyncio
 import os
 
+import fsspec
+import numpy as np
+from fsspec.asyn import AsyncFileSystem
+
 import pysegy as seg  # noqa: E402
 
 DATAFILE = os.path.join(
@@ -25,3 +30,82 @@ def test_segy_scan_directory_pattern():
     assert scan.paths[idx].endswith("overthrust_2D_shot_1_20.segy")
     assert scan.counts[idx] == 127
     assert scan.summary(idx)["GroupX"] == (100, 6400)
+
+
+class _SlowAsyncFS(AsyncFileSystem):
+    """
+    Asynchronous stand-in for an object store serving local files.
+    """
+
+    cachable = False
+
+    def __init__(self, **kwargs):
+        super().__init__(asynchronous=True, **kwargs)
+        self.inflight = 0
+        self.peak = 0
+        self.requests = 0
+
+    async def _cat_file(self, path, start=None, end=None, **kwargs):
+        self.requests += 1
+        self.inflight += 1
+        self.peak = max(self.peak, self.inflight)
+        await asyncio.sleep(0.002)
+        with open(path, "rb") as f:
+            f.seek(start or 0)
+            data = f.read(-1 if end is None else end - (start or 0))
+        self.inflight -= 1
+        return data
+
+    async def _size(self, path):
+        return os.path.getsize(path)
+
+
+def test_asegy_read_concurrent_ranges():
+    ref = seg.segy_read(DATAFILE, keys=["GroupX"])
+
+    async def main():
+        fs = _SlowAsyncFS()
+        block = await seg.asegy_read(
+            DATAFILE, keys=["GroupX"], fs=fs, max_request=64 * 1024
+        )
+        return fs, block
+
+    fs, block = asyncio.run(main())
+    np.testing.assert_array_equal(block.data, ref.data)
+    np.testing.assert_array_equal(
+        block.traceheaders["GroupX"], ref.traceheaders["GroupX"]
+    )
+    assert fs.peak >= 10
+
+    mem = fsspec.filesystem("memory")
+    with open(DATAFILE, "rb") as f:
+        mem.pipe("/async/shots.segy", f.read())
+    block = asyncio.run(seg.asegy_read("/async/shots.segy", fs=mem))
+    np.testing.assert_array_equal(block.data, ref.data)
+
+
+def test_scan_aread_data():
+    scan = seg.segy_scan(DATAFILE)
+
+    async def main():
+        fs = _SlowAsyncFS()
+        scan.fs = fs
+        for rec in scan.records:
+            rec.fs = fs
+        blocks = await asyncio.gather(
+            *(scan.aread_data(i, cache=False) for i in range(4))
+        )
+        return fs, blocks
+
+    fs, blocks = asyncio.run(main())
+    assert fs.requests >= 4
+    for rec in scan.records:
+        rec.fs = None
+    scan.fs = None
+    for i, block in enumerate(blocks):
+        np.testing.assert_array_equal(
+            block.data, scan.read_data(i, cache=False).data
+        )
+    # Local files are read from worker threads
+    local = asyncio.run(scan.aread_data(2, cache=False))
+    np.testing.assert_array_equal(local.data, blocks[2].data)
@@ -1,7 +1,9 @@
+import copy
 import os
 import importlib
 import importlib.metadata
 from io import BytesIO
+import warnings
 import fsspec
 
 import numpy as np
@@ -45,7 +47,7 @@ def test_get_header_no_scale():
     th.ns = 1
     block = SeisBlock(fh, [th], np.zeros((1, 1), dtype=np.float32))
     vals = seg.get_header(block, "ns")
-    assert vals == [1]
+    assert vals.tolist() == [1]
 
 
 def test_type_methods_roundtrip():
@@ -130,3 +132,857 @@ def test_scan_errors(tmp_path):
     fs = fsspec.filesystem("file")
     with pytest.raises(FileNotFoundError):
         seg.segy_scan(str(empty), fs=fs)
+
+
+def test_unpack_headers_matches_scalar_reader():
+    with open(DATAFILE, "rb") as f:
+        fh = seg.read_fileheader(f)
+        trace_size = 240 + fh.bfh.ns * 4
+        f.seek(3600)
+        raw = f.read(trace_size * 3)
+        f.seek(3600 + trace_size * 2)
+        th = seg.read_traceheader(f)
+    cols = seg.utils.unpack_headers(
+        raw, 3, ["SourceX", "GroupX", "ns"], True, trace_size
+    )
+    assert cols["SourceX"].dtype == np.int32
+    assert cols["ns"].dtype == np.int16
+    assert cols["GroupX"][2] == th.GroupX
+    assert cols["ns"][2] == th.ns
+
+
+def test_trace_header_table():
+    headers = [BinaryTraceHeader() for _ in range(3)]
+    for i, th in enumerate(headers):
+        th.SourceX = 10 * i
+    table = seg.TraceHeaderTable.from_headers(headers)
+    assert table.keys_loaded == ["SourceX"]
+    assert table["SourceX"].dtype == np.int32
+    assert table[1].SourceX == 10
+    assert table[-1].GroupX == 0
+    table[0].GroupX = 7
+    assert table["GroupX"].tolist() == [7, 0, 0]
+    assert "GroupX" in table.keys_loaded
+    sub = table[1:]
+    assert len(sub) == 2 and sub["SourceX"].tolist() == [10, 20]
+    both = seg.TraceHeaderTable.concatenate([table, sub])
+    assert both["SourceX"].tolist() == [0, 10, 20, 10, 20]
+    assert "TraceHeaderTable" in str(table)
+    assert len(table[::2]) == 2 and len(table[5:]) == 0
+    assert table[[2, -3]]["SourceX"].tolist() == [20, 0]
+    assert len(table[np.array([True, False, True])]) == 2
+    # Tables without loaded columns still count the selected traces
+    assert len(seg.TraceHeaderTable(ntraces=4)[[0, 0, 1]]) == 3
+    with pytest.raises(IndexError):
+        table[3]
+    with pytest.raises(IndexError):
+        table[[0, 3]]
+    with pytest.raises(IndexError):
+        table[np.ones(2, dtype=bool)]
+    with pytest.raises(ValueError):
+        table["ns"] = [1, 2]
+    with open(DATAFILE, "rb") as f:
+        block = seg.read.read_file(f, keys=["SourceX"])
+    assert isinstance(block.traceheaders, seg.TraceHeaderTable)
+    assert block.traceheaders.keys_loaded == ["SourceX"]
+    assert block.traceheaders[0].__getstate__()["values"]["SourceX"] == 400
+
+
+def test_segy_mmap_matches_read(tmp_path):
+    block = seg.segy_read(DATAFILE)
+    with seg.segy_mmap(DATAFILE) as mm:
+        assert len(mm) == len(block)
+        assert "SegyMmap" in str(mm)
+        np.testing.assert_array_equal(mm.data, block.data)
+        np.testing.assert_array_equal(mm[5], block.data[:, 5])
+        hdrs = mm.traceheaders
+        assert hdrs[0].SourceX == 400
+        np.testing.assert_array_equal(
+            hdrs["GroupX"], block.traceheaders["GroupX"]
+        )
+        mapped = mm.to_block(keys=["SourceX"])
+        assert mapped.traceheaders.keys_loaded == ["SourceX"]
+
+    fh = FileHeader()
+    fh.bfh.ns = 2
+    fh.bfh.DataSampleFormat = 5
+    th = BinaryTraceHeader()
+    th.ns = 2
+    data = np.array([[1.0, 3.0], [-2.0, 0.5]], dtype=np.float32)
+    path = tmp_path / "ieee.segy"
+    with open(path, "wb") as f:
+        seg.write.write_block(f, SeisBlock(fh, [th, th], data))
+    mm = seg.segy_mmap(str(path))
+    np.testing.assert_array_equal(mm.data, data)
+    np.testing.assert_array_equal(mm[1:], data[:, 1:])
+    # IEEE samples are strided views over the read-only mapping
+    assert not mm.data.flags.writeable
+    assert not mm.data.flags.owndata
+
+
+def test_ibm_to_ieee_array_matches_scalar():
+    rng = np.random.default_rng(42)
+    words = rng.integers(0, 2**32, size=4096, dtype=np.uint64).astype(np.uint32)
+    words[:3] = [0, 0x80000000, 0x41100000]
+    buf = words.astype(">u4").tobytes()
+    expected = np.array(
+        [seg.ibm.ibm_to_ieee(int(w)) for w in words], dtype=np.float64
+    )
+    with np.errstate(over="ignore"):
+        expected = expected.astype(np.float32)
+    out = seg.ibm.ibm_to_ieee_array(buf, len(words))
+    np.testing.assert_array_equal(out.view(np.uint32), expected.view(np.uint32))
+
+    strided = np.zeros((len(words), 2), dtype=np.float32)
+    res = seg.ibm.ibm_to_ieee_array(
+        words.astype("<u4").tobytes(), bigendian=False, out=strided[:, 1]
+    )
+    assert res.base is strided
+    np.testing.assert_array_equal(strided[:, 1], out)
+    grid = seg.ibm.ibm_to_ieee_array(words.astype(">u4").reshape(64, 64))
+    np.testing.assert_array_equal(grid.ravel(), out)
+
+
+def test_ieee_to_ibm_array_matches_scalar():
+    rng = np.random.default_rng(7)
+    vals = rng.standard_normal(2048) * np.exp(rng.uniform(-60, 60, 2048))
+    vals = vals.astype(np.float32)
+    vals[:3] = [0.0, -0.0, 1e-45]
+    expected = b"".join(seg.ibm.ieee_to_ibm(float(v)) for v in vals)
+    words = seg.ibm.ieee_to_ibm_array(vals)
+    assert words.dtype == np.dtype(">u4")
+    assert words.tobytes() == expected
+    little = seg.ibm.ieee_to_ibm_array(vals, bigendian=False)
+    np.testing.assert_array_equal(little, words)
+    back = seg.ibm.ibm_to_ieee_array(expected, len(vals))
+    np.testing.assert_allclose(back, vals, rtol=1e-6)
+
+
+def test_ieee_to_ibm_non_finite():
+    vals = np.array([np.inf, -np.inf, np.nan, -np.nan, 1e300, -1e300, 1e-300])
+    expected = [0x7FFFFFFF, 0xFFFFFFFF, 0, 0, 0x7FFFFFFF, 0xFFFFFFFF, 0]
+    scalar = [int.from_bytes(seg.ibm.ieee_to_ibm(float(v)), "big") for v in vals]
+    assert scalar == expected
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        words = seg.ibm.ieee_to_ibm_array(vals)
+        words32 = seg.ibm.ieee_to_ibm_array(vals[:4].astype(np.float32))
+    assert words.tolist() == expected
+    assert words32.tolist() == expected[:4]
+    back = seg.ibm.ibm_to_ieee_array(words, len(vals))
+    assert np.isposinf(back[0]) and np.isneginf(back[1])
+
+
+def test_write_ibm_roundtrip_values():
+    fh = FileHeader()
+    fh.bfh.ns = 3
+    fh.bfh.DataSampleFormat = 1
+    data = np.array([[1.0, -2.5], [3.0, 0.0], [0.15625, 1e5]], dtype=np.float32)
+    block = SeisBlock(fh, [BinaryTraceHeader(), BinaryTraceHeader()], data)
+    for bigendian in (True, False):
+        bio = BytesIO()
+        seg.write.write_block(bio, block, bigendian=bigendian)
+        bio.seek(0)
+        out = seg.read.read_file(bio, bigendian=bigendian)
+        np.testing.assert_array_equal(out.data, data)
+
+
+def test_write_block_matches_per_trace_writer():
+    block = seg.segy_read(DATAFILE)
+    block.traceheaders = block.traceheaders[:600]
+    block.data = block.data[:, :600]
+    bio = BytesIO()
+    seg.write_block(bio, block)
+    ref = BytesIO()
+    seg.write_fileheader(ref, block.fileheader)
+    for i, th in enumerate(block.traceheaders):
+        seg.write_traceheader(ref, th)
+        seg.utils.write_samples(ref, block.data[:, i], 1, True)
+    assert bio.getvalue() == ref.getvalue()
+
+
+@pytest.mark.parametrize("method", ["full", "strided", "mmap", "auto"])
+def test_scan_header_io(method):
+    ref = seg.segy_scan(DATAFILE, keys=["GroupX"], header_io="full")
+    scan = seg.segy_scan(DATAFILE, keys=["GroupX"], header_io=method)
+    assert scan.shots == ref.shots
+    assert [r.segments for r in scan.records] == [r.segments for r in ref.records]
+    assert scan.summary(0) == ref.summary(0)
+
+
+def test_read_strided_ranges():
+    fs = fsspec.filesystem("memory")
+    with open(DATAFILE, "rb") as f:
+        fs.pipe("/scan/data.segy", f.read())
+    with fs.open("/scan/data.segy", "rb") as f:
+        full = seg.utils.read_strided(f, 3600, 10, 3244, 240, "full")
+        ranges = seg.utils.read_strided(f, 3600, 10, 3244, 240, "ranges")
+        with pytest.raises(ValueError):
+            seg.utils.read_strided(f, 3600, 10, 3244, 240, "bogus")
+    np.testing.assert_array_equal(full, ranges)
+    scan = seg.segy_scan(
+        "/scan/data.segy", fs=fs, keys=["GroupX"], header_io="ranges"
+    )
+    assert len(scan.shots) == 20
+
+
+def test_scan_chunk_boundaries_are_stitched():
+    ref = seg.segy_scan(DATAFILE, keys=["GroupX", "Offset"])
+    scan = seg.segy_scan(DATAFILE, keys=["GroupX", "Offset"], chunk=7)
+    assert scan.shots == ref.shots
+    assert [r.segments for r in scan.records] == [r.segments for r in ref.records]
+    assert [r.summary for r in scan.records] == [r.summary for r in ref.records]
+    assert all(len(r.segments) == 1 for r in scan.records)
+
+
+def test_scan_process_executor():
+    data_dir = os.path.join(os.path.dirname(__file__), "..", "..", "data")
+    ref = seg.segy_scan(data_dir, "overthrust_2D_shot_*.segy", keys=["GroupX"])
+    scan = seg.segy_scan(
+        data_dir, "overthrust_2D_shot_*.segy", keys=["GroupX"],
+        threads=2, executor="process",
+    )
+    assert scan.shots == ref.shots
+    assert scan.paths == ref.paths
+    assert scan.counts == ref.counts
+    assert scan.summary(3) == ref.summary(3)
+    with pytest.raises(ValueError):
+        seg.segy_scan(DATAFILE, executor="bogus")
+
+
+def test_scan_split_file_ranges(tmp_path):
+    ref = seg.segy_scan(DATAFILE, keys=["GroupX", "Offset"], split_bytes=None)
+    for executor in ("thread", "process"):
+        scan = seg.segy_scan(
+            DATAFILE, keys=["GroupX", "Offset"], threads=3,
+            executor=executor, split_bytes=50_000,
+        )
+        assert scan.shots == ref.shots
+        assert [r.segments for r in scan.records] == [
+            r.segments for r in ref.records
+        ]
+        assert [r.summary for r in scan.records] == [
+            r.summary for r in ref.records
+        ]
+
+    # Files above split_bytes that hold no whole trace are scanned unsplit
+    import shutil
+
+    shutil.copy(DATAFILE, tmp_path / "a.segy")
+    fh = seg.segy_read(DATAFILE).fileheader
+    with seg.SegyWriter(str(tmp_path / "b.segy"), fh):
+        pass
+    split = seg.segy_scan(str(tmp_path), "*.segy", split_bytes=1000)
+    assert split.shots == ref.shots
+
+
+def test_scan_index_roundtrip(tmp_path):
+    import cloudpickle
+    import json
+
+    data_dir = os.path.join(os.path.dirname(__file__), "..", "..", "data")
+    scan = seg.segy_scan(data_dir, "overthrust_2D_shot_*.segy", keys=["GroupX"])
+    dest = tmp_path / "index"
+    seg.save_scan(str(dest), scan)
+    meta = json.loads((dest / "index.json").read_text())
+    assert meta["version"] == 1
+    # Identical file headers are stored once
+    assert len(meta["fileheaders"]) == 1
+    out = seg.load_scan(str(dest))
+    assert isinstance(out.records.coordinates, np.memmap)
+    assert out.shots == scan.shots
+    assert out.paths == scan.paths
+    assert [r.segments for r in out.records] == [r.segments for r in scan.records]
+    assert out.summary(5) == scan.summary(5)
+    assert out[5].fileheader.th == scan[5].fileheader.th
+    assert out[-1] is out[len(out) - 1]
+    np.testing.assert_array_equal(out.read_data(2).data, scan.read_data(2).data)
+
+    legacy = tmp_path / "scan.pkl"
+    with open(legacy, "wb") as f:
+        cloudpickle.dump(scan, f)
+    with pytest.raises(ValueError):
+        seg.load_scan(str(legacy))
+    assert seg.load_scan(str(legacy), allow_pickle=True).shots == scan.shots
+
+    # Scans pickled before selections and spatial queries existed
+    old = copy.copy(scan)
+    del old.filters, old._spatial, old.file_info
+    with open(legacy, "wb") as f:
+        cloudpickle.dump(old, f)
+    loaded = seg.load_scan(str(legacy), allow_pickle=True)
+    np.testing.assert_array_equal(loaded.read_data(2).data, scan.read_data(2).data)
+    assert loaded.select(GroupX=(0, None)).shots == scan.shots
+    x, y = scan.shots[0][:2]
+    assert 0 in loaded.query_box(x, x, y, y)
+
+
+def test_scan_incremental(tmp_path, monkeypatch):
+    import shutil
+    import pysegy.scan as scan_mod
+
+    data_dir = os.path.join(os.path.dirname(__file__), "..", "..", "data")
+    names = sorted(
+        f for f in os.listdir(data_dir) if f.startswith("overthrust_2D_shot_")
+    )[:4]
+    for name in names[:3]:
+        shutil.copy(os.path.join(data_dir, name), tmp_path / name)
+    pattern = "overthrust_2D_shot_*.segy"
+    first = seg.segy_scan(str(tmp_path), pattern, keys=["GroupX"])
+    assert set(first.file_info) == {str(tmp_path / n) for n in names[:3]}
+
+    # Modify one file, add one and delete one
+    changed = tmp_path / names[1]
+    st = os.stat(changed)
+    os.utime(changed, (st.st_atime, st.st_mtime + 10))
+    shutil.copy(os.path.join(data_dir, names[3]), tmp_path / names[3])
+    os.remove(tmp_path / names[0])
+
+    scanned = []
+    orig = scan_mod._scan_runs
+
+    def spy(path, *args, **kwargs):
+        scanned.append(path)
+        return orig(path, *args, **kwargs)
+
+    monkeypatch.setattr(scan_mod, "_scan_runs", spy)
+    dest = tmp_path / "index"
+    seg.save_scan(str(dest), first)
+    inc = seg.segy_scan(
+        str(tmp_path), pattern, keys=["GroupX"], previous=seg.load_scan(str(dest))
+    )
+    assert sorted(set(scanned)) == [str(changed), str(tmp_path / names[3])]
+
+    full = seg.segy_scan(str(tmp_path), pattern, keys=["GroupX"])
+    assert inc.shots == full.shots
+    assert inc.paths == full.paths
+    assert [r.segments for r in inc.records] == [r.segments for r in full.records]
+    assert inc.file_info == full.file_info
+
+
+def test_scan_spatial_queries():
+    data_dir = os.path.join(os.path.dirname(__file__), "..", "..", "data")
+    scan = seg.segy_scan(data_dir, "overthrust_2D_shot_*.segy")
+    xy = np.array(scan.shots, dtype=np.float64)[:, :2]
+    x0, x1 = np.percentile(xy[:, 0], [20, 45])
+    box = scan.query_box(x0, x1, xy[:, 1].min(), xy[:, 1].max())
+    ref = np.nonzero((xy[:, 0] >= x0) & (xy[:, 0] <= x1))[0]
+    np.testing.assert_array_equal(box, ref)
+
+    x, y = xy[10] + 3.0
+    dist = np.hypot(xy[:, 0] - x, xy[:, 1] - y)
+    np.testing.assert_array_equal(
+        scan.query_radius(x, y, 500.0), np.nonzero(dist <= 500.0)[0]
+    )
+    near = scan.nearest(x, y, k=4)
+    assert near[0] == 10
+    np.testing.assert_allclose(dist[near], np.sort(dist)[:4])
+    assert len(scan.query_box(-10.0, -5.0, -10.0, -5.0)) == 0
+
+
+def test_grid_index_clustered_with_outliers():
+    rng = np.random.default_rng(3)
+    centres = rng.uniform(4e5, 6e5, (20, 2))
+    xy = centres[rng.integers(0, 20, 20000)] + rng.normal(0, 50, (20000, 2))
+    xy = np.vstack([xy, np.zeros((5, 2)), [[1e6, 1e6]]])
+    index = seg.spatial.GridIndex(xy)
+    # Cells follow the clusters, not the box stretched by the outliers
+    assert index.cell < 50.0
+    for x, y in np.vstack([xy[rng.integers(0, len(xy), 20)], [[1.0, 1.0]]]):
+        dist = np.hypot(xy[:, 0] - x, xy[:, 1] - y)
+        np.testing.assert_array_equal(
+            index.query_radius(x, y, 30.0), np.nonzero(dist <= 30.0)[0]
+        )
+        box = index.query_box(x - 20, x + 40, y - 10, y + 10)
+        inside = (np.abs(xy[:, 0] - x - 10) <= 30) & (np.abs(xy[:, 1] - y) <= 10)
+        np.testing.assert_array_equal(box, np.nonzero(inside)[0])
+        np.testing.assert_allclose(dist[index.nearest(x, y, 7)], np.sort(dist)[:7])
+
+
+def test_scan_select_zone_map(tmp_path):
+    data_dir = os.path.join(os.path.dirname(__file__), "..", "..", "data")
+    scan = seg.segy_scan(data_dir, "overthrust_2D_shot_*.segy", keys=["GroupX"])
+    lo, hi = 2000, 3000
+    sel = scan.select(GroupX=(lo, hi))
+    expected = [
+        r.coordinates for r in scan.records
+        if r.summary["GroupX"][1] >= lo and r.summary["GroupX"][0] <= hi
+    ]
+    assert 0 < len(sel) < len(scan)
+    assert sel.shots == expected
+    # Without exact filtering whole shots are returned
+    assert sel.read_data(0).data.shape[1] == sel.counts[0]
+
+    exact = scan.select(GroupX=(lo, hi), exact=True)
+    block = exact.read_data(0, keys=["SourceX"])
+    gx = seg.get_header(block, "GroupX")
+    assert len(gx) == block.data.shape[1] > 0
+    assert ((gx >= lo) & (gx <= hi)).all()
+    full = scan.read_data(scan.shots.index(exact.shots[0]))
+    keep = (seg.get_header(full, "GroupX") >= lo) & (
+        seg.get_header(full, "GroupX") <= hi
+    )
+    np.testing.assert_array_equal(block.data, full.data[:, keep])
+
+    seg.save_scan(str(tmp_path / "index"), scan)
+    loaded = seg.load_scan(str(tmp_path / "index"))
+    assert loaded.select(GroupX=(lo, None)).shots == scan.select(
+        GroupX=(lo, None)
+    ).shots
+    with pytest.raises(KeyError):
+        scan.select(Offset=(0, 10))
+
+
+def test_scan_select_exact_scaled_keys(tmp_path):
+    import asyncio
+
+    fh = seg.FileHeader()
+    fh.bfh.ns, fh.bfh.DataSampleFormat = 4, 5
+    table = seg.TraceHeaderTable(ntraces=6)
+    table["SourceX"], table["RecSourceScalar"] = 100, -10
+    table["GroupX"] = np.arange(6) * 10000
+    table["Offset"] = np.arange(6)
+    path = str(tmp_path / "scaled.segy")
+    seg.segy_write(path, seg.SeisBlock(fh, table, np.zeros((4, 6), np.float32)))
+
+    scan = seg.segy_scan(path, keys=["GroupX"])
+    sel = scan.select(GroupX=(0, 2500), exact=True)
+    # GroupX is compared after applying RecSourceScalar, even when only
+    # other keys are requested
+    blocks = [
+        sel.read_data(0, keys=["Offset"], cache=False),
+        asyncio.run(sel.aread_data(0, keys=["Offset"], cache=False)),
+        sel.read_many([0], keys=["Offset"])[0],
+    ]
+    for block in blocks:
+        assert block.traceheaders["Offset"].tolist() == [0, 1, 2]
+
+
+@pytest.mark.parametrize("max_gap", [0, 64 * 1024])
+def test_read_segments_coalesced(max_gap):
+    from pysegy.read import plan_segments, read_segment_headers, read_segments
+
+    block = seg.segy_read(DATAFILE, keys=["SourceX", "GroupX"])
+    ns = block.fileheader.bfh.ns
+    trace_size = 240 + ns * 4
+
+    def off(i):
+        return 3600 + i * trace_size
+
+    picks = [(10, 3), (0, 2), (5, 1), (13, 2), (200, 4), (0, 0)]
+    segments = [(off(i), n) for i, n in picks]
+    cols = np.concatenate([np.arange(i, i + n) for i, n in picks])
+    plan = plan_segments(segments, trace_size, max_gap)
+    assert len(plan) == (2 if max_gap else 4)
+
+    with open(DATAFILE, "rb") as f:
+        hdrs, data = read_segments(
+            f, segments, ns, block.fileheader.bfh.DataSampleFormat,
+            ["SourceX", "GroupX"], max_gap=max_gap,
+        )
+        only = read_segment_headers(f, segments, ns, ["GroupX"], max_gap=max_gap)
+    np.testing.assert_array_equal(data, block.data[:, cols])
+    np.testing.assert_array_equal(hdrs["GroupX"], block.traceheaders["GroupX"][cols])
+    np.testing.assert_array_equal(only["GroupX"], block.traceheaders["GroupX"][cols])
+
+    rec = seg.ShotRecord(
+        DATAFILE, (0, 0, 0), block.fileheader, segments=segments
+    )
+    np.testing.assert_array_equal(rec.read_data(), block.data[:, cols])
+    assert [h.GroupX for h in rec.read_headers(["GroupX"])] == list(
+        block.traceheaders["GroupX"][cols]
+    )
+
+
+def test_scan_read_many():
+    data_dir = os.path.join(os.path.dirname(__file__), "..", "..", "data")
+    scan = seg.segy_scan(data_dir, "overthrust_2D_shot_*.segy", keys=["GroupX"])
+    idx = [40, 3, 95, 3]
+    blocks = scan.read_many(idx, keys=["GroupX"], max_workers=4)
+    for i, b in zip(idx, blocks):
+        ref = scan.read_data(i, keys=["GroupX"])
+        np.testing.assert_array_equal(b.data, ref.data)
+        np.testing.assert_array_equal(
+            b.traceheaders["GroupX"], ref.traceheaders["GroupX"]
+        )
+
+    counts = [scan.counts[i] for i in idx]
+    out = np.full((4, scan.fileheader.bfh.ns, max(counts) + 2), np.nan, np.float32)
+    res = scan.read_many(idx, out=out)
+    assert res is out
+    for j, b in enumerate(blocks):
+        np.testing.assert_array_equal(out[j, :, : counts[j]], b.data)
+        assert not out[j, :, counts[j]:].any()
+    with pytest.raises(ValueError):
+        scan.read_many(idx, out=np.zeros((2, 3, 4), np.float32))
+
+    sel = scan.select(GroupX=(2000, 3000), exact=True)
+    padded = sel.read_many([0, 1], pad=True)
+    first = sel.read_data(0).data
+    np.testing.assert_array_equal(padded[0, :, : first.shape[1]], first)
+
+
+def test_scan_iter_shots_prefetch():
+    data_dir = os.path.join(os.path.dirname(__file__), "..", "..", "data")
+    scan = seg.segy_scan(data_dir, "overthrust_2D_shot_*.segy")
+    seen = []
+    for i, block in scan.iter_shots(prefetch=3):
+        np.testing.assert_array_equal(block.data, scan.read_data(i).data)
+        seen.append(i)
+    assert seen == list(range(len(scan)))
+
+    by_file = [i for i, _ in scan.iter_shots(order="file", prefetch=0)]
+    keys = [(scan.paths[i], scan.offsets[i]) for i in by_file]
+    assert keys == sorted(keys)
+    spatial = [i for i, _ in scan.iter_shots(order="spatial")]
+    assert sorted(spatial) == list(range(len(scan)))
+    assert [i for i, _ in scan.iter_shots(order=[5, 2])] == [5, 2]
+
+    # At most prefetch reads run ahead of the shot being processed
+    read_data = scan.read_data
+    started = []
+
+    def counting(i, keys=None, cache=True, samples=None):
+        assert cache is False
+        started.append(i)
+        return read_data(i, keys, cache=cache, samples=samples)
+
+    scan.read_data = counting
+    for prefetch in (0, 2):
+        started.clear()
+        for n, _ in enumerate(scan.iter_shots(prefetch=prefetch), 1):
+            assert len(started) <= min(n + prefetch, len(scan))
+    del scan.read_data
+
+    # Stopping early does not read the whole scan
+    it = scan.iter_shots(prefetch=2)
+    next(it)
+    it.close()
+    with pytest.raises(ValueError):
+        next(scan.iter_shots(order="random"))
+
+
+def test_shot_cache_lru_budget():
+    cache = seg.ShotCache(max_bytes=2500)
+    a, b, c = (np.zeros(250, np.float32) for _ in range(3))
+    cache.put("a", a)
+    cache.put("b", b)
+    assert cache.get("a") is a
+    cache.put("c", c)
+    # "b" was least recently used
+    assert "b" not in cache and "a" in cache and "c" in cache
+    assert cache.stats["evictions"] == 1
+    assert cache.nbytes == 2000
+    assert not a.flags.writeable
+    big = cache.put("big", np.zeros(1000, np.float32))
+    assert "big" not in cache and not big.flags.writeable
+    assert cache.get_or_load("c", lambda: 1 / 0) is c
+    assert cache.get("missing") is None
+    assert (cache.hits, cache.misses) == (2, 1)
+    cache.resize(1000)
+    assert len(cache) == 1
+
+    data_dir = os.path.join(os.path.dirname(__file__), "..", "..", "data")
+    scan = seg.segy_scan(data_dir, "overthrust_2D_shot_*.segy")
+    seg.shot_cache.clear()
+    first = scan.read_data(3)
+    # Blocks hold writable copies, so edits never reach the cache
+    first.data[0, 0] = 1.0
+    first.traceheaders[0].GroupX = 5
+    again = scan.read_data(3)
+    assert seg.shot_cache.stats["hits"] == 1
+    fresh = scan.read_data(3, cache=False)
+    assert fresh.data.flags.writeable
+    np.testing.assert_array_equal(fresh.data, again.data)
+    assert first.traceheaders[0].GroupX == 5
+    assert again.traceheaders[0].GroupX == fresh.traceheaders[0].GroupX != 5
+    seg.shot_cache.clear()
+
+
+def test_shot_cache_invalidated_by_writes(tmp_path):
+    import shutil
+
+    path = str(tmp_path / "shots.segy")
+    shutil.copy(DATAFILE, path)
+    scan = seg.segy_scan(path)
+    seg.shot_cache.clear()
+    before = scan.read_data(0).traceheaders["GroupX"]
+    assert scan.read_data(0).traceheaders["GroupX"].tolist() == before.tolist()
+    seg.segy_patch_headers(path, {"GroupX": 7})
+    assert (scan.read_data(0).traceheaders["GroupX"] == 7).all()
+
+    n = len(scan.read_data(0))
+    with seg.SegyWriter(path, mode="r+") as w:
+        w.write_traces(None, np.ones((scan.fileheader.bfh.ns, n), np.float32), 0)
+    assert (scan.read_data(0).data == 1).all()
+    assert (scan[0].data == 1).all()
+    assert seg.shot_cache.invalidate(path) == 2
+    assert len(seg.shot_cache) == 0
+
+
+def test_segy_writer_streaming_and_append(tmp_path):
+    block = seg.segy_read(DATAFILE, keys=["SourceX", "GroupX"])
+    out = tmp_path / "stream.segy"
+    n = block.data.shape[1]
+    with seg.SegyWriter(str(out), block.fileheader) as w:
+        for start in range(0, 200, 70):
+            stop = min(start + 70, 200)
+            w.write_traces(block.traceheaders[start:stop], block.data[:, start:stop])
+    with seg.SegyWriter(str(out), block.fileheader, mode="a") as w:
+        assert w.ntraces == 200
+        w.write_traces(list(block.traceheaders[200:n]), block.data[:, 200:])
+        assert w.ntraces == n
+
+    ref = tmp_path / "ref.segy"
+    seg.segy_write(str(ref), block)
+    assert out.read_bytes() == ref.read_bytes()
+
+    other = seg.FileHeader()
+    other.bfh.ns = block.fileheader.bfh.ns + 1
+    other.bfh.DataSampleFormat = block.fileheader.bfh.DataSampleFormat
+    with pytest.raises(ValueError):
+        seg.SegyWriter(str(out), other, mode="a")
+    with seg.SegyWriter(str(out), mode="a") as w:
+        with pytest.raises(ValueError):
+            w.write_traces(None, np.zeros((3, 2), np.float32))
+        w.write_traces(None, np.ones((block.fileheader.bfh.ns, 2), np.float32))
+    back = seg.segy_read(str(out))
+    assert back.data.shape[1] == n + 2
+    np.testing.assert_array_equal(back.data[:, -1], 1.0)
+
+
+def test_segy_writer_concurrent_appends(tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+
+    fh = seg.FileHeader()
+    fh.bfh.ns = 4
+    fh.bfh.DataSampleFormat = 5
+    size = 3 * seg.read.TRACE_CHUNKSIZE + 7
+    out = tmp_path / "append.segy"
+    with seg.SegyWriter(str(out), fh) as w:
+        def append(batch):
+            w.write_traces(None, np.full((4, size), batch, np.float32))
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(append, range(8)))
+        assert w.ntraces == 8 * size
+    # Every batch lands as one contiguous run of traces
+    runs = seg.segy_read(str(out)).data[0].reshape(8, size)
+    assert (runs == runs[:, :1]).all()
+    assert sorted(runs[:, 0]) == list(range(8))
+
+
+def test_segy_writer_positional_parallel(tmp_path):
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+    block = seg.segy_read(DATAFILE, keys=["SourceX", "GroupX"])
+    n = block.data.shape[1]
+    ref = tmp_path / "ref.segy"
+    seg.segy_write(str(ref), block)
+
+    out = tmp_path / "pwrite.segy"
+    ranges = [(s, min(s + 37, n)) for s in range(0, n, 37)][::-1]
+    with seg.SegyWriter(str(out), block.fileheader, ntraces=n) as w:
+        assert os.path.getsize(out) == os.path.getsize(ref)
+        with ThreadPoolExecutor(4) as ex:
+            futures = [
+                ex.submit(
+                    w.write_traces,
+                    block.traceheaders[a:b], block.data[:, a:b], a,
+                )
+                for a, b in ranges
+            ]
+            for fut in futures:
+                fut.result()
+        with pytest.raises(IndexError):
+            w.write_traces(None, block.data[:, :2], n - 1)
+    assert out.read_bytes() == ref.read_bytes()
+
+    # Separate processes reopen the preallocated file
+    out2 = tmp_path / "procs.segy"
+    seg.SegyWriter(str(out2), block.fileheader, ntraces=n).close()
+    halves = [(n // 2, n), (0, n // 2)]
+    with ProcessPoolExecutor(2) as ex:
+        list(ex.map(_write_range, [str(out2)] * 2, halves))
+    assert out2.read_bytes() == ref.read_bytes()
+
+
+def _write_range(path, bounds):
+    a, b = bounds
+    block = seg.segy_read(DATAFILE, keys=["SourceX", "GroupX"])
+    with seg.SegyWriter(path, block.fileheader, mode="r+") as w:
+        w.write_traces(block.traceheaders[a:b], block.data[:, a:b], start=a)
+
+
+@pytest.mark.parametrize("method", ["mmap", "strided"])
+def test_segy_patch_headers_in_place(tmp_path, method):
+    block = seg.segy_read(DATAFILE)
+    path = tmp_path / "patch.segy"
+    seg.segy_write(str(path), block)
+    before = path.read_bytes()
+    n = block.data.shape[1]
+
+    sel = np.array([7, 3, 100, 101, 102, n - 1])
+    new_x = np.array([-5, 11, 12, 13, 14, 2**20], dtype=np.int64)
+    count = seg.segy_patch_headers(
+        str(path), {"SourceY": -new_x, "SourceX": new_x, "ElevationScalar": -10},
+        traces=sel, method=method,
+    )
+    assert count == len(sel)
+    after = path.read_bytes()
+    assert len(after) == len(before)
+
+    ns = block.fileheader.bfh.ns
+    trace_size = 240 + ns * 4
+    changed = np.flatnonzero(
+        np.frombuffer(before, np.uint8) != np.frombuffer(after, np.uint8)
+    )
+    rel = (changed - 3600) % trace_size
+    # Only SourceX/SourceY (bytes 72-79) and ElevationScalar (68-69) are
+    # touched
+    assert set(rel.tolist()) <= set(range(68, 70)) | set(range(72, 80))
+
+    out = seg.segy_read(
+        str(path), keys=["SourceX", "SourceY", "ElevationScalar"]
+    )
+    np.testing.assert_array_equal(out.traceheaders["SourceX"][sel], new_x)
+    np.testing.assert_array_equal(out.traceheaders["SourceY"][sel], -new_x)
+    assert (out.traceheaders["ElevationScalar"][sel] == -10).all()
+    np.testing.assert_array_equal(out.data, block.data)
+    mask = np.ones(n, dtype=bool)
+    mask[sel] = False
+    np.testing.assert_array_equal(
+        out.traceheaders["SourceX"][mask], block.traceheaders["SourceX"][mask]
+    )
+
+    with pytest.raises(ValueError):
+        seg.segy_patch_headers(str(path), {"ElevationScalar": 2**20}, traces=[0])
+    with pytest.raises(ValueError):
+        seg.segy_patch_headers(str(path), {"SourceX": [1, 2]}, traces=[0])
+    with pytest.raises(KeyError):
+        seg.segy_patch_headers(str(path), {"NotAField": 1})
+
+
+def test_segy_mmap_writable_headers(tmp_path):
+    block = seg.segy_read(DATAFILE)
+    path = tmp_path / "mm.segy"
+    seg.segy_write(str(path), block)
+    with seg.segy_mmap(str(path), writable=True) as mm:
+        mm.traceheaders["GroupX"][:5] = 42
+    out = seg.segy_read(str(path), keys=["GroupX"])
+    assert (out.traceheaders["GroupX"][:5] == 42).all()
+    np.testing.assert_array_equal(out.data, block.data)
+
+
+def test_sample_window_reads(monkeypatch):
+    from pysegy.read import read_traces
+
+    block = seg.segy_read(DATAFILE, keys=["GroupX"])
+    ns = block.fileheader.bfh.ns
+    win = (10, 400, 3)
+    part = seg.segy_read(DATAFILE, keys=["GroupX"], samples=win)
+    np.testing.assert_array_equal(part.data, block.data[10:400:3])
+    assert part.fileheader.bfh.ns == len(range(*win))
+    assert part.fileheader.bfh.dt == 3 * block.fileheader.bfh.dt
+    np.testing.assert_array_equal(
+        part.traceheaders["GroupX"], block.traceheaders["GroupX"]
+    )
+
+    # Only the bytes up to the last selected sample are requested
+    long_ns = 2000
+    fh = seg.FileHeader()
+    fh.bfh.ns = long_ns
+    fh.bfh.DataSampleFormat = 5
+    long_data = np.random.default_rng(0).standard_normal((long_ns, 50))
+    long_block = seg.SeisBlock(
+        fh, [seg.BinaryTraceHeader() for _ in range(50)], long_data.astype(np.float32)
+    )
+    mem = fsspec.filesystem("memory")
+    seg.segy_write("/window/shots.segy", long_block, fs=mem)
+    requested = []
+    orig = type(mem).cat_ranges
+
+    def spy(self, paths, starts, ends, *args, **kwargs):
+        requested.extend(e - s for s, e in zip(starts, ends))
+        return orig(self, paths, starts, ends, *args, **kwargs)
+
+    monkeypatch.setattr(type(mem), "cat_ranges", spy)
+    with mem.open("/window/shots.segy", "rb") as f:
+        f.seek(3600)
+        _, d = read_traces(f, long_ns, 50, 5, ["GroupX"], samples=(0, 100))
+        assert f.tell() == 3600 + 50 * (240 + long_ns * 4)
+    np.testing.assert_array_equal(d, long_block.data[:100])
+    assert requested == [240 + 100 * 4] * 50
+
+    scan = seg.segy_scan(DATAFILE)
+    sub = scan.read_data(1, samples=slice(None, 250), cache=False)
+    full = scan.read_data(1, cache=False)
+    np.testing.assert_array_equal(sub.data, full.data[:250])
+    assert sub.fileheader.bfh.ns == 250 and scan.fileheader.bfh.ns == ns
+    np.testing.assert_array_equal(
+        scan[1].read_data(samples=(5, None, 2)), full.data[5::2]
+    )
+    with pytest.raises(ValueError):
+        scan[1].read_data(samples=(None, None, -1))
+
+
+def test_sample_window_roundtrip(tmp_path):
+    fh = seg.FileHeader()
+    fh.bfh.ns, fh.bfh.dt, fh.bfh.DataSampleFormat = 100, 2000, 5
+    table = seg.TraceHeaderTable(ntraces=6)
+    table["ns"], table["dt"], table["DelayRecordingTime"] = 100, 2000, 50
+    data = np.arange(600, dtype=np.float32).reshape(100, 6)
+    path = str(tmp_path / "full.segy")
+    seg.segy_write(path, seg.SeisBlock(fh, table, data))
+
+    keys = ["ns", "dt", "DelayRecordingTime"]
+    blocks = [
+        seg.segy_read(path, keys=keys, samples=(20, 80, 2)),
+        seg.segy_read(path, keys=keys, samples=(20, 80, 2), traces=[4, 1]),
+        seg.segy_scan(path).read_data(0, keys=keys, samples=(20, 80, 2)),
+    ]
+    for part in blocks:
+        th = part.traceheaders
+        assert (th["ns"] == 30).all() and (th["dt"] == 4000).all()
+        # The delay moves to the first kept sample, 20 samples of 2 ms later
+        assert (th["DelayRecordingTime"] == 90).all()
+
+    # A windowed block written back reads as a self-consistent file
+    out = str(tmp_path / "window.segy")
+    seg.segy_write(out, blocks[0])
+    back = seg.segy_read(out, keys=keys)
+    assert (back.fileheader.bfh.ns, back.fileheader.bfh.dt) == (30, 4000)
+    np.testing.assert_array_equal(back.data, data[20:80:2])
+    for k in keys:
+        np.testing.assert_array_equal(back.traceheaders[k], blocks[0].traceheaders[k])
+
+
+def test_segy_read_trace_subset():
+    from pysegy.read import trace_runs
+
+    block = seg.segy_read(DATAFILE, keys=["GroupX"])
+    n = block.data.shape[1]
+    idx = np.array([50, 51, 52, 7, 8, -1, 3000, 3001, 3002, 3003, 51])
+    part = seg.segy_read(DATAFILE, keys=["GroupX"], traces=idx)
+    want = np.where(idx < 0, idx + n, idx)
+    np.testing.assert_array_equal(part.data, block.data[:, want])
+    np.testing.assert_array_equal(
+        part.traceheaders["GroupX"], block.traceheaders["GroupX"][want]
+    )
+
+    ts = 240 + block.fileheader.bfh.ns * 4
+    assert trace_runs(idx[:5], n, ts) == [(3600 + 50 * ts, 3), (3600 + 7 * ts, 2)]
+
+    mask = np.zeros(n, dtype=bool)
+    mask[::97] = True
+    part = seg.segy_read(DATAFILE, traces=mask, max_gap=0, samples=(0, 20))
+    np.testing.assert_array_equal(part.data, block.data[:20, mask])
+    assert part.fileheader.bfh.ns == 20
+
+    with pytest.raises(IndexError):
+        seg.segy_read(DATAFILE, traces=[n])
+    with pytest.raises(IndexError):
+        seg.segy_read(DATAFILE, traces=mask[:-1])
+    assert seg.segy_read(DATAFILE, traces=[]).data.shape == (
+        block.fileheader.bfh.ns, 0
+    )
@@ -304,13 +304,14 @@ def test_index_and_lazy_data():
     scan = seg.segy_scan(DATAFILE)
     rec = scan[0]
     assert rec.coordinates == scan.shots[0]
-    assert rec._data is None
+    seg.shot_cache.clear()
     rec.data
     assert rec.data is not None
-    assert rec._data is not None
+    assert seg.shot_cache.hits == 1 and seg.shot_cache.misses == 1
     assert rec.fileheader.bfh.ns == scan.fileheader.bfh.ns
     all_blocks = scan.data
     assert len(all_blocks) == len(scan.shots)
+    assert len(seg.shot_cache) == 1
 
 
 def test_rec_coordinates():
@@ -350,8 +351,14 @@ def test_get_header_scaling():
     block = SeisBlock(fh, headers, np.zeros((1, 4), dtype=np.float32))
 
     vals = seg.get_header(block, "SourceX")
-    assert vals[:2] == [20, 10]
-    assert vals[2:] == [5, 7]
+    assert isinstance(vals, np.ndarray)
+    assert vals[:2].tolist() == [20, 10]
+    assert vals[2:].tolist() == [5, 7]
 
     raw = seg.get_header(block, "SourceX", scale=False)
-    assert raw == [10, 20, 5, 7]
+    assert raw.tolist() == [10, 20, 5, 7]
+
+    both = seg.get_header(headers, ["SourceX", "RecSourceScalar"])
+    assert both.shape == (4, 2)
+    assert both[:, 0].tolist() == [20, 10, 5, 7]
+    assert both[:, 1].tolist() == [2, -2, 1, 0]
@@ -2,8 +2,10 @@
 Shared data structures for the minimal Python implementation.
 """
 
+from collections.abc import MutableMapping
 from dataclasses import dataclass, field
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+import numpy as np
 
 # Byte locations for binary file header fields
 FH_BYTE2SAMPLE: Dict[str, int] = {
@@ -285,7 +287,7 @@ class BinaryTraceHeader:
         return self.__str__()
 
     def __getstate__(self):
-        return {"values": self.values, "keys_loaded": self.keys_loaded}
+        return {"values": dict(self.values), "keys_loaded": list(self.keys_loaded)}
 
     def __setstate__(self, state):
         super().__setattr__("values", state["values"])
@@ -302,16 +304,219 @@ class BinaryTraceHeader:
         return "\n".join(lines)
 
 
+def _column_dtype(name: str) -> np.dtype:
+    """
+    Return the native integer dtype used to store header ``name``.
+    """
+    return np.dtype(np.int32 if TH_BYTE2SAMPLE[name][1] == 4 else np.int16)
+
+
+class _TraceHeaderRow(MutableMapping):
+    """
+    Mapping view of a single row of a :class:`TraceHeaderTable`.
+    """
+
+    __slots__ = ("table", "idx")
+
+    def __init__(self, table: "TraceHeaderTable", idx: int) -> None:
+        self.table = table
+        self.idx = idx
+
+    def __getitem__(self, name: str) -> int:
+        if name not in TH_BYTE2SAMPLE:
+            raise KeyError(name)
+        col = self.table.columns.get(name)
+        return 0 if col is None else int(col[self.idx])
+
+    def __setitem__(self, name: str, value: int) -> None:
+        self.table.set(name, self.idx, value)
+
+    def __delitem__(self, name: str) -> None:
+        raise TypeError("Trace header fields cannot be deleted")
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(TH_FIELDS)
+
+    def __len__(self) -> int:
+        return len(TH_FIELDS)
+
+
+class TraceHeaderTable:
+    """
+    Columnar storage for the trace headers of many traces.
+
+    Every loaded header field is stored as one typed NumPy array of length
+    ``ntraces``; fields that were never loaded read as zero. Indexing with an
+    integer returns a :class:`BinaryTraceHeader` view of that trace, indexing
+    with a field name returns its column.
+
+    Parameters
+    ----------
+    columns : dict, optional
+        Mapping of header name to array of values, one per trace.
+    ntraces : int, optional
+        Number of traces; inferred from ``columns`` when omitted.
+    """
+
+    def __init__(
+        self,
+        columns: Optional[Dict[str, np.ndarray]] = None,
+        ntraces: Optional[int] = None,
+    ) -> None:
+        columns = dict(columns or {})
+        if ntraces is None:
+            ntraces = len(next(iter(columns.values()))) if columns else 0
+        self.ntraces = int(ntraces)
+        self.columns: Dict[str, np.ndarray] = {}
+        self.keys_loaded: List[str] = []
+        for k, v in columns.items():
+            self[k] = v
+
+    @classmethod
+    def from_headers(
+        cls,
+        headers: Iterable[BinaryTraceHeader],
+        keys: Optional[Iterable[str]] = None,
+    ) -> "TraceHeaderTable":
+        """
+        Build a table from individual :class:`BinaryTraceHeader` objects.
+
+        When ``keys`` is omitted every field that is loaded or non-zero in
+        any of the headers becomes a column.
+        """
+        headers = list(headers)
+        if keys is None:
+            found = dict.fromkeys(k for h in headers for k in h.keys_loaded)
+            for h in headers:
+                for k, v in h.values.items():
+                    if v and k not in found:
+                        found[k] = None
+            keys = found
+        n = len(headers)
+        columns = {
+            k: np.fromiter(
+                (h.values[k] for h in headers), dtype=_column_dtype(k), count=n
+            )
+            for k in keys
+        }
+        return cls(columns, n)
+
+    @classmethod
+    def concatenate(
+        cls, tables: Iterable["TraceHeaderTable"]
+    ) -> "TraceHeaderTable":
+        """
+        Stack ``tables`` end to end, keeping the union of their columns.
+        """
+        tables = list(tables)
+        keys = dict.fromkeys(k for t in tables for k in t.keys_loaded)
+        columns = {
+            k: np.concatenate([t.column(k) for t in tables])
+            if tables else np.zeros(0, dtype=_column_dtype(k))
+            for k in keys
+        }
+        return cls(columns, sum(len(t) for t in tables))
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        Return the values of ``name`` for every trace.
+        """
+        col = self.columns.get(name)
+        if col is None:
+            return np.zeros(self.ntraces, dtype=_column_dtype(name))
+        return col
+
+    def set(self, name: str, idx, value) -> None:
+        """
+        Assign ``value`` to header ``name`` of the traces selected by ``idx``.
+        """
+        if name not in self.columns:
+            self[name] = self.column(name)
+        self.columns[name][idx] = value
+
+    def __len__(self) -> int:
+        return self.ntraces
+
+    def __getitem__(
+        self, idx: Union[int, str, slice, np.ndarray]
+    ) -> Union[BinaryTraceHeader, np.ndarray, "TraceHeaderTable"]:
+        if isinstance(idx, str):
+            if idx not in TH_BYTE2SAMPLE:
+                raise KeyError(idx)
+            return self.column(idx)
+        if isinstance(idx, (int, np.integer)):
+            if idx < 0:
+                idx += self.ntraces
+            if not 0 <= idx < self.ntraces:
+                raise IndexError("trace index out of range")
+            return BinaryTraceHeader(_TraceHeaderRow(self, int(idx)), self.keys_loaded)
+        if isinstance(idx, slice):
+            ntraces = len(range(self.ntraces)[idx])
+        else:
+            idx = np.asarray(idx)
+            if idx.dtype == bool:
+                if idx.shape != (self.ntraces,):
+                    raise IndexError("boolean mask does not match the traces")
+                ntraces = int(np.count_nonzero(idx))
+            else:
+                if idx.size and idx.dtype.kind not in "iu":
+                    raise IndexError("traces must be selected by integers")
+                idx = idx.astype(np.int64, copy=False).ravel()
+                if len(idx) and not (
+                    -self.ntraces <= idx.min() and idx.max() < self.ntraces
+                ):
+                    raise IndexError("trace index out of range")
+                ntraces = len(idx)
+        sub = {k: v[idx] for k, v in self.columns.items()}
+        return TraceHeaderTable(sub, ntraces)
+
+    def __setitem__(self, name: str, values) -> None:
+        if name not in TH_BYTE2SAMPLE:
+            raise KeyError(name)
+        col = np.asarray(values)
+        size = TH_BYTE2SAMPLE[name][1]
+        if col.dtype.kind not in "iu" or col.dtype.itemsize != size:
+            col = col.astype(_column_dtype(name))
+        if col.ndim == 0:
+            col = np.full(self.ntraces, col, dtype=_column_dtype(name))
+        if len(col) != self.ntraces:
+            raise ValueError(
+                f"Column {name} has {len(col)} values for {self.ntraces} traces"
+            )
+        self.columns[name] = col
+        if name not in self.keys_loaded:
+            self.keys_loaded.append(name)
+
+    def __iter__(self) -> Iterator[BinaryTraceHeader]:
+        for i in range(self.ntraces):
+            yield self[i]
+
+    def __str__(self) -> str:
+        lines = ["TraceHeaderTable:"]
+        lines.append(f"    traces: {self.ntraces}")
+        lines.append(f"    keys: {', '.join(self.keys_loaded)}")
+        return "\n".join(lines)
+
+    __repr__ = __str__
+
+
 @dataclass
 class SeisBlock:
     """
     In-memory representation of a SEGY dataset.
+
+    ``traceheaders`` may be given as a list of :class:`BinaryTraceHeader`,
+    it is converted to a :class:`TraceHeaderTable` on construction.
     """
 
     fileheader: FileHeader
-    traceheaders: List[BinaryTraceHeader]
+    traceheaders: TraceHeaderTable
     data: List[List[float]]
 
+    def __post_init__(self) -> None:
+        if not isinstance(self.traceheaders, TraceHeaderTable):
+            self.traceheaders = TraceHeaderTable.from_headers(self.traceheaders)
+
     def __len__(self) -> int:
         return len(self.traceheaders)
 
@@ -2,14 +2,24 @@
 Utility helpers shared across the :mod:`pysegy` package.
 """
 
-from typing import BinaryIO, Iterable, List, Union
+from typing import BinaryIO, Dict, Iterable, Optional, Tuple, Union
 from contextlib import contextmanager
+import mmap
+import os
 import struct
 from functools import lru_cache
 import numpy as np
 
-from .types import BinaryTraceHeader, SeisBlock
-from .ibm import ibm_to_ieee_array, ieee_to_ibm
+from .types import (
+    BinaryTraceHeader,
+    SeisBlock,
+    TraceHeaderTable,
+    TH_BYTE2SAMPLE,
+)
+from .ibm import ibm_to_ieee_array, ieee_to_ibm_array
+
+# Only skip the bytes between records when the gap spans at least a page
+_MIN_SKIP = 4096
 
 _RECSRC_FIELDS = {
     "SourceX",
@@ -39,6 +49,23 @@ def _check_scale(name: str) -> tuple[bool, str]:
     return False, ""
 
 
+def _apply_scalar(values: np.ndarray, scalars: np.ndarray) -> np.ndarray:
+    """
+    Apply SEGY header ``scalars`` to ``values`` element-wise.
+
+    Positive scalars multiply and negative ones divide by their magnitude.
+    The result stays integral unless a division is involved.
+    """
+    values = values.astype(np.int64)
+    scalars = scalars.astype(np.int64)
+    if not (scalars < 0).any():
+        return np.where(scalars > 0, values * scalars, values)
+    out = values.astype(np.float64)
+    np.multiply(out, scalars, out=out, where=scalars > 0)
+    np.divide(out, -scalars, out=out, where=scalars < 0)
+    return out
+
+
 @lru_cache(maxsize=None)
 def struct_fmt(size: int, bigendian: bool) -> str:
     """
@@ -69,6 +96,75 @@ def pack_int(value: int, size: int, bigendian: bool) -> bytes:
     return struct_obj(size, bigendian).pack(value)
 
 
+@lru_cache(maxsize=None)
+def header_dtype(
+    keys: Tuple[str, ...], bigendian: bool, itemsize: int = 240
+) -> np.dtype:
+    """
+    Return a structured dtype laying out the trace header fields ``keys``.
+
+    The record spans ``itemsize`` bytes so a buffer holding whole traces can
+    be viewed directly, each header field becoming a strided column.
+    """
+    order = ">" if bigendian else "<"
+    return np.dtype({
+        "names": list(keys),
+        "formats": [
+            order + ("i4" if TH_BYTE2SAMPLE[k][1] == 4 else "i2") for k in keys
+        ],
+        "offsets": [TH_BYTE2SAMPLE[k][0] for k in keys],
+        "itemsize": itemsize,
+    })
+
+
+@lru_cache(maxsize=None)
+def trace_dtype(
+    ns: int, datatype: int, keys: Tuple[str, ...], bigendian: bool
+) -> np.dtype:
+    """
+    Return a structured dtype describing one complete trace.
+
+    Header fields ``keys`` are followed by a ``data`` field holding the ``ns``
+    samples, as raw IBM words for format 1 and IEEE floats otherwise.
+    """
+    hdr = header_dtype(keys, bigendian, 240 + ns * 4)
+    sample = (">" if bigendian else "<") + ("u4" if datatype == 1 else "f4")
+    return np.dtype({
+        "names": list(keys) + ["data"],
+        "formats": [hdr.fields[k][0] for k in keys] + [(sample, (ns,))],
+        "offsets": [hdr.fields[k][1] for k in keys] + [240],
+        "itemsize": hdr.itemsize,
+    })
+
+
+def unpack_headers(
+    buf: bytes,
+    ntraces: int,
+    keys: Iterable[str],
+    bigendian: bool,
+    trace_size: int = 240,
+) -> Dict[str, np.ndarray]:
+    """
+    Decode ``keys`` for ``ntraces`` consecutive records of ``buf``.
+
+    Each record is ``trace_size`` bytes long and starts with a 240-byte trace
+    header. The result maps every key to a native-endian integer column.
+    """
+    keys = tuple(dict.fromkeys(keys))
+    dtype = header_dtype(keys, bigendian, trace_size)
+    rec = np.frombuffer(buf, dtype=dtype, count=ntraces)
+    return native_columns(rec, keys)
+
+
+def native_columns(rec: np.ndarray, keys: Iterable[str]) -> Dict[str, np.ndarray]:
+    """
+    Copy the header fields ``keys`` of structured ``rec`` to native arrays.
+    """
+    return {
+        k: rec[k].astype(rec.dtype.fields[k][0].newbyteorder("=")) for k in keys
+    }
+
+
 def read_samples(buf: bytes, ns: int, datatype: int, bigendian: bool) -> np.ndarray:
     """
     Return ``ns`` samples from ``buf`` given the SEGY data type.
@@ -79,6 +175,23 @@ def read_samples(buf: bytes, ns: int, datatype: int, bigendian: bool) -> np.ndar
     return np.frombuffer(buf, dtype=dtype, count=ns)
 
 
+def decode_samples(
+    raw: np.ndarray, datatype: int, out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Convert raw samples viewed from a file to ``float32``.
+
+    ``raw`` holds IBM words for format 1 and IEEE floats otherwise, in any
+    shape or byte order. The result is written to ``out`` when provided.
+    """
+    if datatype == 1:
+        return ibm_to_ieee_array(raw, out=out)
+    if out is None:
+        return raw.astype(np.float32)
+    out[...] = raw
+    return out
+
+
 def write_samples(
     f: BinaryIO, trace: Iterable[float], datatype: int, bigendian: bool
 ) -> None:
@@ -86,12 +199,104 @@ def write_samples(
     Write ``trace`` values to ``f`` according to the SEGY format.
     """
     if datatype == 1:
-        f.write(b"".join(ieee_to_ibm(float(x)) for x in trace))
+        f.write(ieee_to_ibm_array(np.asarray(trace), bigendian).tobytes())
     else:
         fmt = (">" if bigendian else "<") + f"{len(trace)}f"
         f.write(struct.pack(fmt, *trace))
 
 
+def _fileno(f) -> Optional[int]:
+    """
+    Return the OS file descriptor behind ``f`` or ``None`` if there is none.
+    """
+    try:
+        return f.fileno()
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def read_strided(
+    f: BinaryIO,
+    start: int,
+    count: int,
+    stride: int,
+    nbytes: int,
+    method: str = "auto",
+) -> np.ndarray:
+    """
+    Read the leading ``nbytes`` of ``count`` records spaced ``stride`` apart.
+
+    Parameters
+    ----------
+    f : BinaryIO
+        Open binary file handle.
+    start : int
+        Byte offset of the first record.
+    count : int
+        Number of records to read.
+    stride : int
+        Size in bytes of one record, e.g. a whole trace.
+    nbytes : int
+        Number of leading bytes wanted from each record, e.g. ``240``.
+    method : str, optional
+        ``"full"`` reads the records whole and slices them, ``"strided"``
+        issues one positional read per record, ``"mmap"`` copies the slices
+        out of a memory mapping of a local file and ``"ranges"`` requests them
+        as byte ranges through the fsspec filesystem ``f`` belongs to.
+        ``"auto"`` reads whole records when the skipped gap is under a page
+        and otherwise uses ``"mmap"`` for local files and ``"ranges"`` for
+        fsspec files.
+
+    Returns
+    -------
+    numpy.ndarray
+        ``count`` x ``nbytes`` array of ``uint8``.
+    """
+    if method == "auto":
+        if stride - nbytes < _MIN_SKIP:
+            method = "full"
+        elif _fileno(f) is not None:
+            method = "mmap"
+        elif hasattr(f, "fs") and hasattr(f, "path"):
+            method = "ranges"
+        else:
+            method = "full"
+
+    if method == "full":
+        f.seek(start)
+        raw = np.frombuffer(f.read(stride * count), dtype=np.uint8)
+        out = raw.reshape(count, stride)[:, :nbytes]
+        return np.ascontiguousarray(out)
+
+    starts = [start + i * stride for i in range(count)]
+    if method == "strided":
+        fd = _fileno(f)
+        if fd is not None and hasattr(os, "pread"):
+            raw = b"".join(os.pread(fd, nbytes, pos) for pos in starts)
+        else:
+            parts = []
+            for pos in starts:
+                f.seek(pos)
+                parts.append(f.read(nbytes))
+            raw = b"".join(parts)
+    elif method == "mmap":
+        mm = mmap.mmap(_fileno(f), 0, access=mmap.ACCESS_READ)
+        if stride >= 2 * mmap.PAGESIZE and hasattr(mm, "madvise"):
+            # Avoid readahead pulling in the skipped samples
+            mm.madvise(mmap.MADV_RANDOM)
+        view = np.frombuffer(mm, dtype=np.uint8, count=stride * count, offset=start)
+        out = view.reshape(count, stride)[:, :nbytes].copy()
+        del view
+        mm.close()
+        return out
+    elif method == "ranges":
+        ends = [pos + nbytes for pos in starts]
+        raw = b"".join(f.fs.cat_ranges([f.path] * count, starts, ends))
+    else:
+        raise ValueError(f"Unknown read method {method!r}")
+    return np.frombuffer(raw, dtype=np.uint8).reshape(count, nbytes)
+
+
 @contextmanager
 def open_file(path: str, mode: str = "rb", fs=None):
     """
@@ -103,42 +308,71 @@ def open_file(path: str, mode: str = "rb", fs=None):
 
 
 def get_header(
-    src: Union[SeisBlock, Iterable[BinaryTraceHeader]],
-    name: str,
+    src: Union[SeisBlock, TraceHeaderTable, Iterable[BinaryTraceHeader]],
+    name: Union[str, Iterable[str]],
     *,
     scale: bool = True,
-) -> List[float]:
+) -> np.ndarray:
     """
     Return values for ``name`` from ``src`` optionally applying scaling.
+
+    Coordinate and elevation fields are scaled by ``RecSourceScalar`` and
+    ``ElevationScalar`` respectively: positive scalars multiply, negative
+    ones divide by their magnitude.
+
+    Parameters
+    ----------
+    src : SeisBlock, TraceHeaderTable or iterable of BinaryTraceHeader
+        Headers to read from.
+    name : str or Iterable[str]
+        Header field, or several fields fetched in one pass.
+    scale : bool, optional
+        Apply the header scalars when ``True``.
+
+    Returns
+    -------
+    numpy.ndarray
+        One value per trace, or an ``ntraces`` x ``len(name)`` array when
+        several names are requested.
     """
+    names = [name] if isinstance(name, str) else list(name)
     if isinstance(src, SeisBlock):
         headers = src.traceheaders
+    elif isinstance(src, TraceHeaderTable):
+        headers = src
     else:
-        headers = list(src)
-
-    vals = [getattr(h, name) for h in headers]
+        keys = dict.fromkeys(names)
+        for n in names:
+            scalable, scale_name = _check_scale(n)
+            if scalable:
+                keys[scale_name] = None
+        headers = TraceHeaderTable.from_headers(src, keys)
 
-    scalable, scale_name = _check_scale(name)
-    if scale and scalable:
-        scaled: List[float] = []
-        for h, v in zip(headers, vals):
-            fact = getattr(h, scale_name)
-            if fact > 0:
-                scaled.append(v * fact)
-            elif fact < 0:
-                scaled.append(v / abs(fact))
-            else:
-                scaled.append(v)
-        return scaled
-    return vals
+    cols = []
+    for n in names:
+        col = headers.column(n)
+        scalable, scale_name = _check_scale(n)
+        if scale and scalable:
+            cols.append(_apply_scalar(col, headers.column(scale_name)))
+        else:
+            cols.append(col.astype(col.dtype.newbyteorder("=")))
+    if isinstance(name, str):
+        return cols[0]
+    return np.column_stack(cols) if cols else np.zeros((len(headers), 0))
 
 
 __all__ = [
     "get_header",
     "open_file",
     "read_samples",
+    "decode_samples",
+    "native_columns",
+    "read_strided",
     "write_samples",
     "struct_fmt",
+    "header_dtype",
+    "trace_dtype",
+    "unpack_headers",
     "pack_int",
     "unpack_int",
 ]
@@ -2,16 +2,33 @@
 Writing utilities for the minimal Python SEGY implementation.
 """
 
+import os
 import struct
-from typing import BinaryIO
+import threading
+from typing import BinaryIO, Iterable, List, Mapping, Optional, Union
+import numpy as np
 
-from .utils import pack_int, struct_fmt, write_samples, open_file
+from .cache import shot_cache
+from .ibm import ieee_to_ibm_array
+from .memmap import SegyMmap
+from .read import TRACE_CHUNKSIZE, read_fileheader
+from .utils import (
+    _fileno,
+    header_dtype,
+    open_file,
+    pack_int,
+    struct_fmt,
+    trace_dtype,
+)
 from .types import (
     SeisBlock,
     FileHeader,
     BinaryTraceHeader,
+    TraceHeaderTable,
+    _column_dtype,
     FH_BYTE2SAMPLE,
     TH_BYTE2SAMPLE,
+    TH_FIELDS,
 )
 
 
@@ -68,10 +85,37 @@ def write_traceheader(
     f.write(buf)
 
 
+def _pack_traces(
+    headers: TraceHeaderTable,
+    data: np.ndarray,
+    datatype: int,
+    bigendian: bool = True,
+) -> np.ndarray:
+    """
+    Serialise ``headers`` and the ``ns`` x ``n`` ``data`` into one buffer.
+
+    Returns a contiguous structured array laid out exactly like ``n``
+    consecutive traces on disk, headers and samples interleaved.
+    """
+    ns, ntraces = data.shape
+    dtype = trace_dtype(ns, datatype, tuple(TH_FIELDS), bigendian)
+    buf = np.zeros(ntraces, dtype=dtype)
+    for k in headers.keys_loaded:
+        buf[k] = headers.columns[k]
+    if datatype == 1:
+        buf["data"] = ieee_to_ibm_array(data.T, bigendian)
+    else:
+        buf["data"] = data.T
+    return buf
+
+
 def write_block(f: BinaryIO, block: SeisBlock, bigendian: bool = True) -> None:
     """
     Write an entire :class:`SeisBlock` to ``f``.
 
+    Traces are assembled ``TRACE_CHUNKSIZE`` at a time into a single buffer
+    holding headers and samples, so each chunk costs one ``write`` call.
+
     Parameters
     ----------
     f : BinaryIO
@@ -83,10 +127,245 @@ def write_block(f: BinaryIO, block: SeisBlock, bigendian: bool = True) -> None:
     """
     write_fileheader(f, block.fileheader, bigendian)
     dsf = block.fileheader.bfh.DataSampleFormat
-    for i, hdr in enumerate(block.traceheaders):
-        trace = block.data[:, i]
-        write_traceheader(f, hdr, bigendian)
-        write_samples(f, trace, dsf, bigendian)
+    data = np.asarray(block.data)
+    headers = block.traceheaders
+    for start in range(0, len(headers), TRACE_CHUNKSIZE):
+        stop = min(start + TRACE_CHUNKSIZE, len(headers))
+        buf = _pack_traces(
+            headers[start:stop], data[:, start:stop], dsf, bigendian
+        )
+        f.write(buf.view(np.uint8))
+
+
+class SegyWriter:
+    """
+    Stream traces to a SEGY file in batches of any size.
+
+    The file header is written once when the file is created and every call
+    to :meth:`write_traces` appends traces, so memory use is bounded by the
+    batch size. Use as a context manager to close the file automatically.
+
+    Every trace of a fixed-length SEGY file starts at byte
+    ``3600 + i * (240 + ns * 4)``. Passing ``ntraces`` preallocates a file of
+    that many traces and ``write_traces(..., start=i)`` then fills any trace
+    range with positional writes, without a shared file position. Threads
+    may share one writer; other processes open the same file with
+    ``mode="r+"``.
+
+    Parameters
+    ----------
+    path : str
+        Destination file path. When ``fs`` is provided the path is
+        interpreted relative to that filesystem.
+    fileheader : FileHeader, optional
+        Header of the new file. Required with ``mode="w"``. Otherwise it is
+        checked against the header of the existing file.
+    mode : str, optional
+        ``"w"`` creates or truncates the file, ``"a"`` appends traces to an
+        existing file and ``"r+"`` opens an existing file for positional
+        writes. ``ns`` and the sample format of existing files must match
+        ``fileheader``.
+    fs : filesystem-like object, optional
+        Filesystem providing ``open`` when writing to non-local storage.
+    bigendian : bool, optional
+        Write numbers in big-endian order when ``True``.
+    ntraces : int, optional
+        Preallocate room for this many traces when creating the file.
+
+    Examples
+    --------
+    >>> with SegyWriter("out.segy", block.fileheader) as w:
+    ...     for headers, data in batches:
+    ...         w.write_traces(headers, data)
+
+    >>> with SegyWriter("out.segy", fh, ntraces=n) as w, ThreadPoolExecutor() as ex:
+    ...     for start, (headers, data) in jobs:
+    ...         ex.submit(w.write_traces, headers, data, start)
+    """
+
+    def __init__(
+        self,
+        path: str,
+        fileheader: Optional[FileHeader] = None,
+        mode: str = "w",
+        fs=None,
+        bigendian: bool = True,
+        ntraces: Optional[int] = None,
+    ) -> None:
+        self.path = path
+        self.fs = fs
+        self.mode = mode
+        self.bigendian = bigendian
+        self._lock = threading.Lock()
+        if mode == "w":
+            if fileheader is None:
+                raise ValueError("A file header is required to create a file")
+            self.fileheader = fileheader
+            self.ntraces = 0
+            self._f = self._open("wb")
+            write_fileheader(self._f, fileheader, bigendian)
+            if ntraces:
+                self._preallocate(int(ntraces))
+        elif mode in ("a", "r+"):
+            with open_file(path, "rb", fs) as f:
+                existing = read_fileheader(f, bigendian=bigendian)
+                size = f.seek(0, 2)
+            if fileheader is not None:
+                for key in ("ns", "DataSampleFormat"):
+                    new, old = getattr(fileheader.bfh, key), getattr(existing.bfh, key)
+                    if new != old:
+                        raise ValueError(
+                            f"Cannot write to {path}: {key} is {old}, got {new}"
+                        )
+            self.fileheader = existing
+            ntraces, rest = divmod(size - 3600, self.trace_size)
+            if rest:
+                raise ValueError(
+                    f"Cannot write to {path}: size is not a whole number "
+                    "of traces"
+                )
+            self.ntraces = ntraces
+            self._f = self._open("ab" if mode == "a" else "r+b")
+            self._f.seek(0, 2)
+        else:
+            raise ValueError(f"Unknown mode {mode!r}")
+
+    def _open(self, mode: str) -> BinaryIO:
+        shot_cache.invalidate(self.path)
+        return (self.fs.open if self.fs is not None else open)(self.path, mode)
+
+    def _preallocate(self, ntraces: int) -> None:
+        """
+        Extend the file to hold ``ntraces`` zeroed traces.
+        """
+        size = 3600 + ntraces * self.trace_size
+        self._f.flush()
+        fd = _fileno(self._f)
+        try:
+            if fd is None or not hasattr(os, "posix_fallocate"):
+                raise OSError
+            os.posix_fallocate(fd, 0, size)
+        except OSError:
+            self._f.truncate(size)
+        self._f.seek(0, 2)
+        self.ntraces = ntraces
+
+    @property
+    def ns(self) -> int:
+        return self.fileheader.bfh.ns
+
+    @property
+    def trace_size(self) -> int:
+        return 240 + self.ns * 4
+
+    def write_traces(
+        self,
+        headers: Union[TraceHeaderTable, Iterable[BinaryTraceHeader], None],
+        data: np.ndarray,
+        start: Optional[int] = None,
+    ) -> None:
+        """
+        Write a batch of traces.
+
+        Parameters
+        ----------
+        headers : TraceHeaderTable or iterable of BinaryTraceHeader
+            One header per trace. ``None`` writes zeroed headers.
+        data : np.ndarray
+            ``ns`` x ``n`` array of samples.
+        start : int, optional
+            Index of the first trace to overwrite in place. The traces must
+            already exist, e.g. preallocated with ``ntraces``. By default the
+            batch is appended to the end of the file.
+        """
+        data = np.asarray(data, dtype=np.float32)
+        if data.ndim == 1:
+            data = data[:, None]
+        if data.shape[0] != self.ns:
+            raise ValueError(
+                f"Expected {self.ns} samples per trace, got {data.shape[0]}"
+            )
+        ntraces = data.shape[1]
+        if headers is None:
+            headers = TraceHeaderTable(ntraces=ntraces)
+        elif not isinstance(headers, TraceHeaderTable):
+            headers = TraceHeaderTable.from_headers(list(headers))
+        if len(headers) != ntraces:
+            raise ValueError(
+                f"Got {len(headers)} headers for {ntraces} traces"
+            )
+        if start is not None and self.mode == "a":
+            raise ValueError("Positional writes need mode 'w' or 'r+'")
+        if start is not None and not 0 <= start <= self.ntraces - ntraces:
+            raise IndexError(
+                f"Traces {start}..{start + ntraces} are outside the "
+                f"{self.ntraces} traces of {self.path}"
+            )
+
+        dsf = self.fileheader.bfh.DataSampleFormat
+
+        def chunks():
+            for first in range(0, ntraces, TRACE_CHUNKSIZE):
+                stop = min(first + TRACE_CHUNKSIZE, ntraces)
+                yield first, _pack_traces(
+                    headers[first:stop], data[:, first:stop], dsf, self.bigendian
+                ).view(np.uint8)
+
+        if start is not None:
+            for first, buf in chunks():
+                self._pwrite(buf, 3600 + (start + first) * self.trace_size)
+            return
+        # Hold the lock for the whole batch so concurrent appends never
+        # interleave their chunks
+        with self._lock:
+            for _, buf in chunks():
+                self._f.write(buf)
+            self.ntraces += ntraces
+
+    def _pwrite(self, buf: np.ndarray, offset: int) -> None:
+        """
+        Write ``buf`` at byte ``offset`` without moving the file position.
+        """
+        fd = _fileno(self._f)
+        if fd is None or not hasattr(os, "pwrite"):
+            with self._lock:
+                pos = self._f.tell()
+                self._f.seek(offset)
+                self._f.write(buf)
+                self._f.seek(pos)
+            return
+        with self._lock:
+            # Positional writes bypass the buffer of appended traces
+            self._f.flush()
+        view = memoryview(buf).cast("B")
+        while len(view):
+            written = os.pwrite(fd, view, offset)
+            view = view[written:]
+            offset += written
+
+    def close(self) -> None:
+        """
+        Flush and close the output file.
+        """
+        if self._f is not None:
+            self._f.close()
+            self._f = None
+            shot_cache.invalidate(self.path)
+
+    def __enter__(self) -> "SegyWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __str__(self) -> str:
+        lines = ["SegyWriter:"]
+        lines.append(f"    path: {self.path}")
+        lines.append(f"    ns: {self.ns}")
+        lines.append(f"    traces: {self.ntraces}")
+        return "\n".join(lines)
+
+    __repr__ = __str__
 
 
 def segy_write(path: str, block: SeisBlock, fs=None) -> None:
@@ -103,6 +382,115 @@ def segy_write(path: str, block: SeisBlock, fs=None) -> None:
     """
     print(f"Writing SEGY file {path}")
 
+    shot_cache.invalidate(path)
     with open_file(path, "wb", fs) as f:
         write_block(f, block)
     print(f"Finished writing {path}")
+
+
+def segy_patch_headers(
+    path: str,
+    headers: Union[TraceHeaderTable, Mapping[str, np.ndarray]],
+    traces: Union[slice, np.ndarray, None] = None,
+    fs=None,
+    bigendian: bool = True,
+    method: str = "auto",
+) -> int:
+    """
+    Overwrite trace header fields of an existing file in place.
+
+    Only the bytes of the patched header fields are written and nothing is
+    read back, so other header fields and the samples are left untouched
+    even while other writers modify them.
+
+    Parameters
+    ----------
+    path : str
+        SEGY file to modify. When ``fs`` is provided the path is interpreted
+        relative to that filesystem, which must support ``"r+b"``.
+    headers : TraceHeaderTable or mapping
+        New values keyed by trace header name, one per selected trace.
+        Scalars are broadcast. Only the loaded columns of a table are used.
+    traces : slice or array, optional
+        Traces to patch as indices or a boolean mask; all by default.
+    fs : filesystem-like object, optional
+        Filesystem providing ``open`` for non-local storage.
+    bigendian : bool, optional
+        ``True`` when the file is big-endian.
+    method : str, optional
+        ``"mmap"`` assigns through a writable memory map, ``"strided"``
+        writes the bytes of each group of adjacent patched fields of every
+        selected trace with one positional write. ``"auto"`` uses ``"mmap"``
+        for local files.
+
+    Returns
+    -------
+    int
+        Number of traces patched.
+    """
+    if isinstance(headers, TraceHeaderTable):
+        headers = {k: headers.columns[k] for k in headers.keys_loaded}
+    for k in headers:
+        if k not in TH_BYTE2SAMPLE:
+            raise KeyError(k)
+
+    print(f"Patching trace headers {', '.join(headers)} in {path}")
+    with open_file(path, "rb", fs) as f:
+        fh = read_fileheader(f, bigendian=bigendian)
+        size = f.seek(0, 2)
+    trace_size = 240 + fh.bfh.ns * 4
+    ntraces = (size - 3600) // trace_size
+    idx = np.arange(ntraces)[slice(None) if traces is None else traces]
+    idx = np.atleast_1d(idx)
+
+    values = {}
+    for k, v in headers.items():
+        dtype = np.dtype(_column_dtype(k))
+        col = np.asarray(v)
+        if col.ndim == 0:
+            col = np.full(len(idx), col)
+        if len(col) != len(idx):
+            raise ValueError(
+                f"Column {k} has {len(col)} values for {len(idx)} traces"
+            )
+        info = np.iinfo(dtype)
+        if len(col) and (col.min() < info.min or col.max() > info.max):
+            raise ValueError(f"Values of {k} do not fit in {dtype}")
+        values[k] = col.astype(dtype)
+
+    if method == "auto":
+        method = "mmap" if fs is None else "strided"
+    if method == "mmap":
+        with SegyMmap(path, bigendian, writable=True) as mm:
+            table = mm.traceheaders
+            for k, col in values.items():
+                table[k][idx] = col
+    elif method == "strided":
+        # Group fields stored back to back so each group is one write
+        runs: List[List[str]] = []
+        for k in sorted(values, key=lambda k: TH_BYTE2SAMPLE[k][0]):
+            prev = runs[-1][-1] if runs else None
+            if prev is not None and TH_BYTE2SAMPLE[k][0] == sum(TH_BYTE2SAMPLE[prev]):
+                runs[-1].append(k)
+            else:
+                runs.append([k])
+        with open_file(path, "r+b", fs) as f:
+            fd = _fileno(f)
+            for run in runs:
+                first = TH_BYTE2SAMPLE[run[0]][0]
+                end = sum(TH_BYTE2SAMPLE[run[-1]])
+                rec = np.zeros(len(idx), header_dtype(tuple(run), bigendian, end))
+                for k in run:
+                    rec[k] = values[k]
+                raw = rec.view(np.uint8).reshape(len(idx), end)[:, first:]
+                for i, pos in enumerate((3600 + idx * trace_size + first).tolist()):
+                    if fd is not None and hasattr(os, "pwrite"):
+                        os.pwrite(fd, raw[i].tobytes(), pos)
+                    else:
+                        f.seek(pos)
+                        f.write(raw[i].tobytes())
+    else:
+        raise ValueError(f"Unknown patch method {method!r}")
+    shot_cache.invalidate(path)
+    print(f"Patched {len(idx)} traces in {path}")
+    return len(idx)